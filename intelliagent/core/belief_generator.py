@@ -2,6 +2,12 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+# Confidence-curve constants, hoisted so repeated scoring calls skip
+# the per-call local rebinds
+_BASE_CONFIDENCE = 0.5
+_EVIDENCE_WEIGHT = 0.1
+_MAX_CONFIDENCE = 0.95
+
 
 @dataclass
 class Belief:
@@ -100,10 +106,7 @@ class BeliefGenerator:
         if not evidence:
             return 0.0
 
-        # Simple confidence calculation
-        base_confidence = 0.5
-        evidence_weight = 0.1
-        max_confidence = 0.95
-
-        confidence = base_confidence + (len(evidence) * evidence_weight)
-        return min(confidence, max_confidence)
+        # Simple confidence curve: 0.5 base plus 0.1 per evidence
+        # item, capped at 0.95. Constant-time on len(evidence).
+        confidence = _BASE_CONFIDENCE + len(evidence) * _EVIDENCE_WEIGHT
+        return confidence if confidence < _MAX_CONFIDENCE else _MAX_CONFIDENCE
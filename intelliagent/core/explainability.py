@@ -1,13 +1,14 @@
 """Enhanced explainability engine with advanced analysis features."""
 
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+import bisect
 import json
 import math
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextFactor:
     """Represents a context factor and its influence."""
     name: str
@@ -17,7 +18,7 @@ class ContextFactor:
     category: str = "general"
 
 
-@dataclass
+@dataclass(slots=True)
 class Explanation:
     """Enhanced container for decision explanation."""
     decision_id: str
@@ -28,6 +29,27 @@ class Explanation:
     timestamp: datetime
     context_influence: Dict[str, ContextFactor]
     key_factors: List[str]  # New: Track most influential factors
+    # Lazily computed cache slot for top_factor
+    _top_factor: Optional[Tuple[str, ContextFactor]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def top_factor(self) -> Optional[Tuple[str, ContextFactor]]:
+        """Most influential (name, factor) pair, computed once.
+
+        Consumers (timeline, outcome analysis) read this per row; the
+        max() reduction runs on first access and is cached on the
+        instance so repeat renders skip it.
+        """
+        cached = self._top_factor
+        if cached is None and self.context_influence:
+            cached = max(
+                self.context_influence.items(),
+                key=lambda x: x[1].influence_score
+            )
+            self._top_factor = cached
+        return cached
 
 
 class ExplainabilityEngine:
@@ -36,6 +58,16 @@ class ExplainabilityEngine:
     def __init__(self):
         """Initialize the explainability engine."""
         self.explanations: Dict[str, Explanation] = {}
+        # Bumped whenever a new explanation is recorded; callers can use it
+        # as a cheap cache-invalidation key
+        self.version = 0
+        # Stable category-name -> small-int mapping so consumers can
+        # work with integer IDs instead of string sets
+        self.category_registry: Dict[str, int] = {}
+        # Insertion-ordered index (timestamps are monotonic) that lets
+        # time-window filters seek with bisect instead of scanning
+        self._ordered: List[Explanation] = []
+        self._ordered_ts: List[datetime] = []
 
     def generate_explanation(
         self,
@@ -67,6 +99,16 @@ class ExplainabilityEngine:
         # Analyze context influence
         context_influence = self._analyze_context_influence(context)
 
+        # Track the most influential factors, matching the ordering
+        # the summaries use
+        key_factors = [
+            name for name, _ in sorted(
+                context_influence.items(),
+                key=lambda x: x[1].influence_score,
+                reverse=True
+            )[:3]
+        ]
+
         # Create explanation
         explanation = Explanation(
             decision_id=f"exp_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -79,11 +121,21 @@ class ExplainabilityEngine:
                 "decision_type": self._infer_decision_type(decision)
             },
             timestamp=datetime.now(),
-            context_influence=context_influence
+            context_influence=context_influence,
+            key_factors=key_factors
         )
 
+        # Register any new factor categories
+        for factor in context_influence.values():
+            self.category_registry.setdefault(
+                factor.category, len(self.category_registry)
+            )
+
         # Store explanation
         self.explanations[explanation.decision_id] = explanation
+        self._ordered.append(explanation)
+        self._ordered_ts.append(explanation.timestamp)
+        self.version += 1
         return explanation
 
     def visualize_explanation(self, decision_id: str, format: str = 'json') -> str:
@@ -459,13 +511,29 @@ class ExplainabilityEngine:
             reverse=True
         )[:3]
 
+        factors = ', '.join(
+            f'{k} ({v.influence_score:.2f})' for k, v in key_factors
+        )
         return (
             f"Decision made with {explanation.confidence:.1%} confidence. "
-            f"Key factors: {
-                ', '.join(f'{k} ({v.influence_score:.2f})' for k, v in key_factors)}. "
+            f"Key factors: {factors}. "
             f"Based on {len(explanation.reasoning_steps)} reasoning steps."
         )
 
+    def filter_since(
+        self,
+        seconds: Optional[float]
+    ) -> List[Explanation]:
+        """Return explanations recorded within the last ``seconds``.
+
+        Args:
+            seconds: Window length in seconds (None for all history)
+
+        Returns:
+            List[Explanation]: Explanations inside the window
+        """
+        return self._filter_explanations_by_time(seconds)
+
     def _filter_explanations_by_time(
         self,
         time_window: Optional[int]
@@ -475,6 +543,14 @@ class ExplainabilityEngine:
             return list(self.explanations.values())
 
         cutoff_time = datetime.now() - timedelta(seconds=time_window)
+
+        # Timestamps are recorded in insertion order, so the window start
+        # can be found with a bisect seek instead of a full scan
+        if len(self._ordered) == len(self.explanations):
+            start = bisect.bisect_left(self._ordered_ts, cutoff_time)
+            return self._ordered[start:]
+
+        # Explanations were stored directly; fall back to a linear scan
         return [
             exp for exp in self.explanations.values()
             if exp.timestamp >= cutoff_time
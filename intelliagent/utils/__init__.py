@@ -2,12 +2,14 @@
 
 from .cache_manager import CacheManager
 from .context_analyzer import ContextAnalyzer
+from .data_processor import DataProcessor
 from .rate_limiter import RateLimiter
 from .logger import Logger
 
 __all__ = [
     "CacheManager",
     "ContextAnalyzer",
+    "DataProcessor",
     "RateLimiter",
     "Logger"
 ]
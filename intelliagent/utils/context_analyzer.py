@@ -1,11 +1,94 @@
-from typing import Dict, Optional
+import re
+from typing import Deque, Dict, List, Optional, Tuple
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+
+_HISTORY_SIZE = 10
+
+_KEY_POINT_INDICATORS = ('must', 'should',
+                         'important', 'key', 'critical', 'need')
+
+# Maps sentence terminators to a sentinel so splitting is a C-level
+# translate + split instead of a regex engine pass
+_SENTENCE_SPLIT_TABLE = str.maketrans('.!?', '\x00\x00\x00')
+
+_POSITIVE_WORDS = frozenset(
+    {"good", "great", "excellent", "amazing", "wonderful"})
+_NEGATIVE_WORDS = frozenset({"bad", "poor", "terrible", "awful", "horrible"})
+
+
+def _classify_words(text: str) -> Tuple[int, int, int]:
+    """Tokenize and classify sentiment polarity in a single pass.
+
+    Returns:
+        Tuple[int, int, int]: (word_count, positive_count, negative_count).
+    """
+    word_count = positive_count = negative_count = 0
+    for word in text.lower().split():
+        word_count += 1
+        if word in _POSITIVE_WORDS:
+            positive_count += 1
+        elif word in _NEGATIVE_WORDS:
+            negative_count += 1
+    return word_count, positive_count, negative_count
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text on sentence terminators, dropping empty fragments."""
+    return [
+        part for part in text.translate(_SENTENCE_SPLIT_TABLE).split('\x00')
+        if part
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _extract_key_points(text: str) -> Tuple[str, ...]:
+    """Extract key points from text, memoized on the input string."""
+    key_points = []
+
+    for sentence in _split_sentences(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+
+        # Identify sentences with important indicators
+        if any(indicator in sentence.lower()
+               for indicator in _KEY_POINT_INDICATORS):
+            key_points.append(sentence)
+
+    return tuple(key_points)
+
+
+@lru_cache(maxsize=1024)
+def _calculate_complexity(text: str) -> float:
+    """Calculate text complexity score, memoized on the input string."""
+    words = text.split()
+    if not words:
+        return 0.0
+
+    avg_word_length = sum(len(word) for word in words) / len(words)
+    sentence_count = len(_split_sentences(text))
+
+    return (avg_word_length * 0.5) + (len(words) / max(sentence_count, 1) * 0.5)
 
 
 class ContextAnalyzer:
     def __init__(self):
         """Initialize the context analyzer."""
-        self.context_history: Dict[str, list] = {}
+        self.context_history: Dict[str, Deque[Dict]] = {}
+        self.sentiment_keywords = {
+            'positive': ['good', 'great', 'excellent', 'happy', 'profit',
+                         'gain'],
+            'negative': ['bad', 'poor', 'terrible', 'unhappy', 'loss',
+                         'decline'],
+            'neutral': ['okay', 'normal', 'standard', 'regular', 'usual']
+        }
+        self.entity_patterns = {
+            'email': r'[\w.+-]+@[\w-]+\.[\w.-]+',
+            'phone': r'\+?\d{7,15}',
+            'money': r'\$\d+(?:\.\d{2})?'
+        }
 
     def analyze(
         self,
@@ -14,9 +97,12 @@ class ContextAnalyzer:
         user_id: Optional[str] = None
     ) -> Dict:
         """Analyze input and context to provide enriched context."""
+        # One timestamp per call, shared with history tracking
+        timestamp = datetime.now().isoformat()
+
         # Track context history if user_id provided
         if user_id:
-            self._track_context(user_id, context)
+            self._track_context(user_id, context, timestamp)
 
         # Extract key information from input
         extracted_info = self._extract_info(input_data)
@@ -25,119 +111,79 @@ class ContextAnalyzer:
         enriched_context = {
             **context,
             **extracted_info,
-            "timestamp": datetime.now().isoformat(),
-            "input_length": len(input_data),
-            "context_keys": list(context.keys())
-        }
-        self.sentiment_keywords = {
-            'positive': ['good', 'great', 'excellent', 'happy', 'profit', 'gain'],
-            'negative': ['bad', 'poor', 'terrible', 'unhappy', 'loss', 'decline'],
-            'neutral': ['okay', 'normal', 'standard', 'regular', 'usual']
-        }
-        self.sentiment_keywords = {
-            'positive': ['good', 'great', 'excellent', 'happy', 'profit', 'gain'],
-            'negative': ['bad', 'poor', 'terrible', 'unhappy', 'loss', 'decline'],
-            'neutral': ['okay', 'normal', 'standard', 'regular', 'usual']
+            "timestamp": timestamp,
+            "input_length": len(input_data)
         }
 
         return enriched_context
 
-    def _extract_info(self, input_data: str) -> Dict:
-        """Extract key information from input text."""
-        # Simple extraction for now
-        words = input_data.lower().split()
+    def analyze_input(self, input_data: str) -> Dict:
+        """Run the full analysis pipeline on a piece of input text."""
+        words = re.findall(r'\w+', input_data.lower())
         return {
+            "entities": self._extract_entities(input_data),
+            "sentiment": self._score_sentiment(words),
+            "key_points": self._extract_key_points(input_data),
+            "complexity": self._calculate_complexity(input_data),
             "word_count": len(words),
-            "has_question": "?" in input_data,
-            "sentiment": self._analyze_sentiment(words)
+            "has_question": "?" in input_data
         }
 
-    def _analyze_sentiment(self, words: list) -> str:
-        """Basic sentiment analysis."""
-        positive_words = {"good", "great", "excellent", "amazing", "wonderful"}
-        negative_words = {"bad", "poor", "terrible", "awful", "horrible"}
+    def merge_contexts(self, old_context: Dict, new_context: Dict) -> Dict:
+        """Merge an old context into a new one, combining shared fields."""
+        merged = {**old_context, **new_context}
 
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        old_entities = old_context.get("entities")
+        new_entities = new_context.get("entities")
+        if isinstance(old_entities, list) and isinstance(new_entities, list):
+            merged["entities"] = old_entities + new_entities
+        elif isinstance(old_entities, dict) and isinstance(new_entities, dict):
+            merged["entities"] = {
+                key: old_entities.get(key, []) + new_entities.get(key, [])
+                for key in {**old_entities, **new_entities}
+            }
 
-        if positive_count > negative_count:
-            return "positive"
-        elif negative_count > positive_count:
-            return "negative"
-        return "neutral"
+        old_sentiment = old_context.get("sentiment")
+        new_sentiment = new_context.get("sentiment")
+        if isinstance(old_sentiment, dict) and isinstance(new_sentiment, dict):
+            merged["sentiment"] = {**old_sentiment, **new_sentiment}
 
-    def _track_context(self, user_id: str, context: Dict) -> None:
-        """Track context history for a user."""
-        if user_id not in self.context_history:
-            self.context_history[user_id] = []
+        old_metadata = old_context.get("metadata")
+        new_metadata = new_context.get("metadata")
+        if isinstance(old_metadata, dict) and isinstance(new_metadata, dict):
+            merged["metadata"] = {**old_metadata, **new_metadata}
 
-        self.context_history[user_id].append({
-            "context": context,
-            "timestamp": datetime.now().isoformat()
-        })
+        return merged
 
-        for sentiment, keywords in self.sentiment_keywords.items():
-            matches = sum(1 for word in words if word in keywords)
-            scores[sentiment] = matches
-            total_matches += matches
+    def _extract_info(self, input_data: str) -> Dict:
+        """Extract key information from input text."""
+        word_count, positive_count, negative_count = _classify_words(
+            input_data)
 
-        # Normalize scores
-        if total_matches > 0:
-            for sentiment in scores:
-                scores[sentiment] /= total_matches
+        if positive_count > negative_count:
+            sentiment = "positive"
+        elif negative_count > positive_count:
+            sentiment = "negative"
         else:
-            scores['neutral'] = 1.0
+            sentiment = "neutral"
 
-        return scores
-
-    def _extract_key_points(self, text: str) -> List[str]:
-        """Extract key points from text."""
-        sentences = re.split(r'[.!?]+', text)
-        key_points = []
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            # Identify sentences with important indicators
-            indicators = ['must', 'should',
-                          'important', 'key', 'critical', 'need']
-            if any(indicator in sentence.lower() for indicator in indicators):
-                key_points.append(sentence)
-
-        return key_points
-
-    def _calculate_complexity(self, text: str) -> float:
-        """Calculate text complexity score."""
-        words = text.split()
-        if not words:
-            return 0.0
-
-        avg_word_length = sum(len(word) for word in words) / len(words)
-        sentence_count = len(re.split(r'[.!?]+', text))
-
-        return (avg_word_length * 0.5) + (len(words) / max(sentence_count, 1) * 0.5)
-
-        return enriched_context
-
-    def _extract_info(self, input_data: str) -> Dict:
-        """Extract key information from input text."""
-        # Simple extraction for now
-        words = input_data.lower().split()
         return {
-            "word_count": len(words),
+            "word_count": word_count,
             "has_question": "?" in input_data,
-            "sentiment": self._analyze_sentiment(words)
+            "sentiment": sentiment
+        }
+
+    def _extract_entities(self, text: str) -> Dict[str, List[str]]:
+        """Extract known entity types (emails, phones, money) from text."""
+        return {
+            entity_type: re.findall(pattern, text)
+            for entity_type, pattern in self.entity_patterns.items()
         }
 
     def _analyze_sentiment(self, words: list) -> str:
         """Basic sentiment analysis."""
-        positive_words = {"good", "great", "excellent", "amazing", "wonderful"}
-        negative_words = {"bad", "poor", "terrible", "awful", "horrible"}
-
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        positive_count = sum(1 for word in words if word in _POSITIVE_WORDS)
+        negative_count = sum(1 for word in words if word in _NEGATIVE_WORDS)
 
         if positive_count > negative_count:
             return "positive"
@@ -145,15 +191,10 @@ class ContextAnalyzer:
             return "negative"
         return "neutral"
 
-    def _track_context(self, user_id: str, context: Dict) -> None:
-        """Track context history for a user."""
-        if user_id not in self.context_history:
-            self.context_history[user_id] = []
-
-        self.context_history[user_id].append({
-            "context": context,
-            "timestamp": datetime.now().isoformat()
-        })
+    def _score_sentiment(self, words: list) -> Dict[str, float]:
+        """Score sentiment as normalized keyword-match frequencies."""
+        scores = {sentiment: 0.0 for sentiment in self.sentiment_keywords}
+        total_matches = 0
 
         for sentiment, keywords in self.sentiment_keywords.items():
             matches = sum(1 for word in words if word in keywords)
@@ -171,68 +212,70 @@ class ContextAnalyzer:
 
     def _extract_key_points(self, text: str) -> List[str]:
         """Extract key points from text."""
-        sentences = re.split(r'[.!?]+', text)
-        key_points = []
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            # Identify sentences with important indicators
-            indicators = ['must', 'should',
-                          'important', 'key', 'critical', 'need']
-            if any(indicator in sentence.lower() for indicator in indicators):
-                key_points.append(sentence)
-
-        return key_points
+        return list(_extract_key_points(text))
 
     def _calculate_complexity(self, text: str) -> float:
         """Calculate text complexity score."""
-        words = text.split()
-        if not words:
-            return 0.0
-
-        avg_word_length = sum(len(word) for word in words) / len(words)
-        sentence_count = len(re.split(r'[.!?]+', text))
-
-        return (avg_word_length * 0.5) + (len(words) / max(sentence_count, 1) * 0.5)
-
-        return enriched_context
-
-    def _extract_info(self, input_data: str) -> Dict:
-        """Extract key information from input text."""
-        # Simple extraction for now
-        words = input_data.lower().split()
-        return {
-            "word_count": len(words),
-            "has_question": "?" in input_data,
-            "sentiment": self._analyze_sentiment(words)
-        }
+        return _calculate_complexity(text)
 
-    def _analyze_sentiment(self, words: list) -> str:
-        """Basic sentiment analysis."""
-        positive_words = {"good", "great", "excellent", "amazing", "wonderful"}
-        negative_words = {"bad", "poor", "terrible", "awful", "horrible"}
-
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
-
-        if positive_count > negative_count:
-            return "positive"
-        elif negative_count > positive_count:
-            return "negative"
-        return "neutral"
-
-    def _track_context(self, user_id: str, context: Dict) -> None:
+    def _calculate_relevance(
+        self,
+        old_context: Dict,
+        current_context: Dict
+    ) -> float:
+        """Score how relevant an old context is to the current one."""
+        score = 0.0
+
+        old_entities = self._flatten_entities(old_context.get("entities"))
+        current_entities = self._flatten_entities(
+            current_context.get("entities"))
+        if current_entities:
+            overlap = len(old_entities & current_entities)
+            score += (overlap / len(current_entities)) * 0.5
+
+        old_sentiment = old_context.get("sentiment", {})
+        current_sentiment = current_context.get("sentiment", {})
+        shared = set(old_sentiment) & set(current_sentiment)
+        if shared:
+            difference = sum(
+                abs(old_sentiment[key] - current_sentiment[key])
+                for key in shared
+            ) / len(shared)
+            score += max(0.0, 1.0 - difference) * 0.3
+
+        try:
+            age_seconds = (
+                datetime.fromisoformat(current_context["timestamp"]) -
+                datetime.fromisoformat(old_context["timestamp"])
+            ).total_seconds()
+            score += 0.2 / (1 + max(0.0, age_seconds) / 3600)
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        return score
+
+    @staticmethod
+    def _flatten_entities(entities) -> set:
+        """Flatten an entity mapping or list into a set of values."""
+        if isinstance(entities, dict):
+            return {value for values in entities.values() for value in values}
+        if isinstance(entities, list):
+            return set(entities)
+        return set()
+
+    def _track_context(
+        self,
+        user_id: str,
+        context: Dict,
+        timestamp: Optional[str] = None
+    ) -> None:
         """Track context history for a user."""
         if user_id not in self.context_history:
-            self.context_history[user_id] = []
+            # deque drops the oldest entry automatically, so appends stay
+            # O(1) instead of rebuilding the list with a slice each call
+            self.context_history[user_id] = deque(maxlen=_HISTORY_SIZE)
 
         self.context_history[user_id].append({
             "context": context,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp or datetime.now().isoformat()
         })
-
-        # Keep only last 10 contexts
-        self.context_history[user_id] = self.context_history[user_id][-10:]
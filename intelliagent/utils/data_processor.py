@@ -0,0 +1,49 @@
+"""Data processing helpers for preparing inputs and decision payloads."""
+
+from typing import Dict, List
+from datetime import datetime
+
+
+class DataProcessor:
+    def __init__(self):
+        """Initialize the data processor."""
+        self.processed_count = 0
+
+    def process_input(self, input_data: str) -> str:
+        """Normalize raw input text for downstream analysis.
+
+        Args:
+            input_data: Raw input text.
+
+        Returns:
+            str: Cleaned input text.
+        """
+        self.processed_count += 1
+        return " ".join(input_data.split())
+
+    def process_batch(self, inputs: List[str]) -> List[str]:
+        """Normalize a batch of raw inputs.
+
+        Args:
+            inputs: Raw input texts.
+
+        Returns:
+            List[str]: Cleaned input texts.
+        """
+        return [self.process_input(item) for item in inputs]
+
+    def prepare_payload(self, input_data: str, context: Dict) -> Dict:
+        """Bundle cleaned input and context into a decision payload.
+
+        Args:
+            input_data: Raw input text.
+            context: Context information.
+
+        Returns:
+            Dict: Payload with cleaned input, context and timestamp.
+        """
+        return {
+            "input": self.process_input(input_data),
+            "context": context,
+            "timestamp": datetime.now().isoformat()
+        }
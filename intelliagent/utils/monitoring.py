@@ -7,7 +7,6 @@ import logging
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from threading import Thread
-from queue import Queue
 import json
 from pathlib import Path
 
@@ -43,20 +42,32 @@ class SystemMonitor:
     def __init__(
         self,
         interval: float = 1.0,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        capacity: int = 256
     ):
         """Initialize the system monitor.
 
+        Samples are stored in a preallocated single-producer single-consumer
+        ring of SystemMetrics instances that the monitor loop mutates in
+        place, so steady-state collection allocates nothing per tick.
+
         Args:
             interval: Sampling interval in seconds
             output_dir: Directory to save metrics (optional)
+            capacity: Number of ring-buffer slots to preallocate
         """
         self.interval = interval
         self.output_dir = Path(output_dir) if output_dir else None
-        self.metrics_queue: Queue = Queue()
         self.is_running = False
         self.monitoring_thread: Optional[Thread] = None
         self.process = psutil.Process(os.getpid())
+        self._capacity = capacity
+        self._pool = [
+            SystemMetrics(0.0, 0.0, 0.0, 0.0, {}, {})
+            for _ in range(capacity)
+        ]
+        # Total samples written; published only after a slot is fully filled
+        self._write_index = 0
 
     def start(self) -> None:
         """Start monitoring system metrics."""
@@ -81,27 +92,29 @@ class SystemMonitor:
         while self.is_running:
             try:
                 metrics = self._collect_metrics()
-                self.metrics_queue.put(metrics)
                 self._save_metrics(metrics)
                 time.sleep(self.interval)
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
 
     def _collect_metrics(self) -> SystemMetrics:
-        """Collect current system metrics."""
-        return SystemMetrics(
-            timestamp=time.time(),
-            cpu_percent=psutil.cpu_percent(),
-            memory_percent=psutil.virtual_memory().percent,
-            disk_usage_percent=psutil.disk_usage('/').percent,
-            network_io_counters=dict(psutil.net_io_counters()._asdict()),
-            process_metrics={
-                'cpu_percent': self.process.cpu_percent(),
-                'memory_percent': self.process.memory_percent(),
-                'num_threads': self.process.num_threads(),
-                'num_fds': self.process.num_fds()
-            }
-        )
+        """Collect current system metrics into the next ring-buffer slot."""
+        slot = self._pool[self._write_index % self._capacity]
+        slot.timestamp = time.time()
+        slot.cpu_percent = psutil.cpu_percent()
+        slot.memory_percent = psutil.virtual_memory().percent
+        slot.disk_usage_percent = psutil.disk_usage('/').percent
+        slot.network_io_counters.clear()
+        slot.network_io_counters.update(psutil.net_io_counters()._asdict())
+        slot.process_metrics.clear()
+        slot.process_metrics.update({
+            'cpu_percent': self.process.cpu_percent(),
+            'memory_percent': self.process.memory_percent(),
+            'num_threads': self.process.num_threads(),
+            'num_fds': self.process.num_fds()
+        })
+        self._write_index += 1
+        return slot
 
     def _save_metrics(self, metrics: SystemMetrics) -> None:
         """Save metrics to file if output directory is specified."""
@@ -116,9 +129,9 @@ class SystemMonitor:
 
     def get_latest_metrics(self) -> Optional[SystemMetrics]:
         """Get the most recent metrics."""
-        if self.metrics_queue.empty():
+        if self._write_index == 0:
             return None
-        return self.metrics_queue.get()
+        return self._pool[(self._write_index - 1) % self._capacity]
 
     def get_average_metrics(
         self,
@@ -132,9 +145,11 @@ class SystemMonitor:
         Returns:
             Averaged system metrics or None if no samples available
         """
-        metrics_list: List[SystemMetrics] = []
-        while not self.metrics_queue.empty() and len(metrics_list) < num_samples:
-            metrics_list.append(self.metrics_queue.get())
+        available = min(num_samples, self._write_index, self._capacity)
+        metrics_list: List[SystemMetrics] = [
+            self._pool[(self._write_index - 1 - offset) % self._capacity]
+            for offset in range(available)
+        ]
 
         if not metrics_list:
             return None
@@ -1,19 +1,40 @@
 """Rate limiter implementation for API request management."""
 
-from typing import Dict, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+import threading
+from typing import Dict
+from datetime import datetime
+
+import numpy as np
+
+_WINDOW_SECONDS = 60.0
+_N_SHARDS = 64
 
 
 class RateLimiter:
-    def __init__(self, requests_per_minute: int = 60):
+    def __init__(self, requests_per_minute: int = 60, max_users: int = 1024):
         """Initialize the rate limiter.
 
+        Per-user state lives in preallocated structure-of-arrays storage:
+        one shared (max_users, requests_per_minute) timestamp ring buffer
+        plus head/count index arrays, so checking a limit never allocates
+        per-user Python objects.
+
+        Thread safety uses sharded locks keyed by user id rather than one
+        global mutex, so concurrent requests only contend with users that
+        hash to the same shard.
+
         Args:
             requests_per_minute: Maximum number of requests allowed per minute.
+            max_users: Initial number of user slots to preallocate. Storage
+                doubles automatically when more users are seen.
         """
         self.requests_per_minute = requests_per_minute
-        self.request_history: Dict[str, list] = defaultdict(list)
+        self._user_index: Dict[str, int] = {}
+        self._ts = np.zeros((max_users, requests_per_minute), dtype=np.float64)
+        self._head = np.zeros(max_users, dtype=np.int32)
+        self._count = np.zeros(max_users, dtype=np.int32)
+        self._index_lock = threading.Lock()
+        self._locks = [threading.Lock() for _ in range(_N_SHARDS)]
 
     def check_limit(self, user_id: str) -> bool:
         """Check if user has exceeded their rate limit.
@@ -24,14 +45,20 @@ class RateLimiter:
         Returns:
             bool: True if request is allowed, False if limit exceeded.
         """
-        now = datetime.now()
-        self._cleanup_history(user_id, now)
+        now = self._now()
+        idx = self._index_for(user_id)
+
+        with self._locks[hash(user_id) % _N_SHARDS]:
+            self._expire(idx, now)
 
-        if len(self.request_history[user_id]) >= self.requests_per_minute:
-            return False
+            if self._count[idx] >= self.requests_per_minute:
+                return False
 
-        self.request_history[user_id].append(now)
-        return True
+            tail = (self._head[idx] + self._count[idx]) \
+                % self.requests_per_minute
+            self._ts[idx, tail] = now
+            self._count[idx] += 1
+            return True
 
     def get_remaining_requests(self, user_id: str) -> int:
         """Get number of remaining requests for user.
@@ -42,20 +69,74 @@ class RateLimiter:
         Returns:
             int: Number of remaining requests allowed.
         """
-        now = datetime.now()
-        self._cleanup_history(user_id, now)
+        idx = self._index_for(user_id)
 
-        return max(0, self.requests_per_minute - len(self.request_history[user_id]))
+        with self._locks[hash(user_id) % _N_SHARDS]:
+            self._expire(idx, self._now())
 
-    def _cleanup_history(self, user_id: str, current_time: datetime) -> None:
-        """Remove requests older than 1 minute from history.
+            return max(0, self.requests_per_minute - int(self._count[idx]))
+
+    @staticmethod
+    def _now() -> float:
+        """Return the current time as a POSIX timestamp."""
+        return datetime.now().timestamp()
+
+    def _index_for(self, user_id: str) -> int:
+        """Return the storage slot for a user, assigning one if new.
 
         Args:
             user_id: Unique identifier for the user.
+
+        Returns:
+            int: Row index into the timestamp ring buffer.
+        """
+        idx = self._user_index.get(user_id)
+        if idx is None:
+            with self._index_lock:
+                idx = self._user_index.get(user_id)
+                if idx is None:
+                    idx = len(self._user_index)
+                    if idx >= self._ts.shape[0]:
+                        self._grow()
+                    self._user_index[user_id] = idx
+        return idx
+
+    def _grow(self) -> None:
+        """Double the preallocated per-user storage.
+
+        Holds every shard lock while the arrays are copied so in-flight
+        updates are not lost. Callers must already hold ``_index_lock``;
+        it is always taken before shard locks, which keeps lock ordering
+        consistent and deadlock-free.
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            rows = self._ts.shape[0]
+            self._ts = np.concatenate([self._ts, np.zeros_like(self._ts)])
+            self._head = np.concatenate(
+                [self._head, np.zeros(rows, dtype=np.int32)])
+            self._count = np.concatenate(
+                [self._count, np.zeros(rows, dtype=np.int32)])
+        finally:
+            for lock in self._locks:
+                lock.release()
+
+    def _expire(self, idx: int, current_time: float) -> None:
+        """Drop ring-buffer entries older than 1 minute for a user slot.
+
+        Args:
+            idx: Row index into the timestamp ring buffer.
             current_time: Current timestamp for comparison.
         """
-        cutoff_time = current_time - timedelta(minutes=1)
-        self.request_history[user_id] = [
-            timestamp for timestamp in self.request_history[user_id]
-            if timestamp > cutoff_time
-        ]
+        cutoff_time = current_time - _WINDOW_SECONDS
+        head = int(self._head[idx])
+        count = int(self._count[idx])
+        size = self.requests_per_minute
+
+        while count and self._ts[idx, head] <= cutoff_time:
+            head = (head + 1) % size
+            count -= 1
+
+        self._head[idx] = head
+        self._count[idx] = count
@@ -0,0 +1,194 @@
+"""Numeric kernels backing the heavier visualizations.
+
+The correlation heatmap and category-evolution charts reduce lists of
+``Explanation`` objects to dense NumPy arrays and run their inner loops
+here. When numba is installed the loops are JIT-compiled (parallel where
+it helps); otherwise vectorized NumPy fallbacks keep the module
+dependency-free.
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    _HAVE_NUMBA = False
+    prange = range
+
+
+def factor_matrix(explanations: Sequence) -> Tuple[np.ndarray, List[str]]:
+    """Flatten factor influence scores into a dense (N, F) matrix.
+
+    Missing factors are encoded as NaN so pairwise statistics can keep
+    the "only explanations containing both factors" semantics.
+
+    Args:
+        explanations: Explanations whose context_influence to project.
+
+    Returns:
+        Tuple[np.ndarray, List[str]]: float32 matrix of shape
+        (n_explanations, n_factors) and the sorted factor names that
+        label its columns.
+    """
+    factor_list = sorted({
+        name
+        for exp in explanations
+        for name in exp.context_influence
+    })
+    column_index = {name: j for j, name in enumerate(factor_list)}
+
+    matrix = np.full(
+        (len(explanations), len(factor_list)), np.nan, dtype=np.float32
+    )
+    for row, exp in enumerate(explanations):
+        for name, factor in exp.context_influence.items():
+            matrix[row, column_index[name]] = factor.influence_score
+
+    return matrix, factor_list
+
+
+def _pearson_matrix_loops(matrix: np.ndarray) -> np.ndarray:
+    """Pairwise Pearson correlations over NaN-masked columns.
+
+    Written in nopython-compatible form so numba can compile it; the
+    outer loop parallelizes over factor columns.
+    """
+    n_rows, n_factors = matrix.shape
+    out = np.zeros((n_factors, n_factors), dtype=np.float32)
+
+    for i in prange(n_factors):
+        out[i, i] = 1.0
+        for j in range(i + 1, n_factors):
+            count = 0
+            sum_a = 0.0
+            sum_b = 0.0
+            for k in range(n_rows):
+                a = matrix[k, i]
+                b = matrix[k, j]
+                if a == a and b == b:  # both present (NaN-safe)
+                    count += 1
+                    sum_a += a
+                    sum_b += b
+
+            if count < 2:
+                continue
+
+            mean_a = sum_a / count
+            mean_b = sum_b / count
+            cov = 0.0
+            var_a = 0.0
+            var_b = 0.0
+            for k in range(n_rows):
+                a = matrix[k, i]
+                b = matrix[k, j]
+                if a == a and b == b:
+                    delta_a = a - mean_a
+                    delta_b = b - mean_b
+                    cov += delta_a * delta_b
+                    var_a += delta_a * delta_a
+                    var_b += delta_b * delta_b
+
+            if var_a > 0.0 and var_b > 0.0:
+                value = cov / np.sqrt(var_a * var_b)
+            else:
+                value = np.nan
+            out[i, j] = value
+            out[j, i] = value
+
+    return out
+
+
+def _pearson_matrix_numpy(matrix: np.ndarray) -> np.ndarray:
+    """NumPy fallback with one masked reduction per factor pair.
+
+    When every factor is present in every explanation (the common
+    case), a single BLAS-backed np.corrcoef call replaces the pairwise
+    loop entirely.
+    """
+    n_rows, n_factors = matrix.shape
+    out = np.zeros((n_factors, n_factors), dtype=np.float32)
+    valid = ~np.isnan(matrix)
+
+    if n_rows >= 2 and n_factors >= 2 and valid.all():
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dense = np.corrcoef(matrix, rowvar=False)
+        np.fill_diagonal(dense, 1.0)
+        return dense.astype(np.float32)
+
+    for i in range(n_factors):
+        out[i, i] = 1.0
+        for j in range(i + 1, n_factors):
+            mask = valid[:, i] & valid[:, j]
+            if np.count_nonzero(mask) < 2:
+                continue
+
+            col_a = matrix[mask, i].astype(np.float64)
+            col_b = matrix[mask, j].astype(np.float64)
+            col_a -= col_a.mean()
+            col_b -= col_b.mean()
+            norm = np.sqrt((col_a * col_a).sum() * (col_b * col_b).sum())
+
+            value = (col_a * col_b).sum() / norm if norm > 0.0 else np.nan
+            out[i, j] = value
+            out[j, i] = value
+
+    return out
+
+
+def _rolling_mean_numpy(values: np.ndarray, window: int) -> np.ndarray:
+    """Cumulative-sum rolling mean matching pandas' leading-NaN shape."""
+    n_rows = values.shape[0]
+    out = np.full(n_rows, np.nan, dtype=np.float64)
+    if window <= 0 or n_rows < window:
+        return out
+
+    cumulative = np.cumsum(values, dtype=np.float64)
+    out[window - 1] = cumulative[window - 1] / window
+    out[window:] = (cumulative[window:] - cumulative[:-window]) / window
+    return out
+
+
+def _rolling_mean_loops(values: np.ndarray, window: int) -> np.ndarray:
+    """Sliding-window rolling mean in nopython-compatible form."""
+    n_rows = values.shape[0]
+    out = np.full(n_rows, np.nan, dtype=np.float64)
+    if window <= 0 or n_rows < window:
+        return out
+
+    total = 0.0
+    for k in range(window):
+        total += values[k]
+    out[window - 1] = total / window
+
+    for k in range(window, n_rows):
+        total += values[k] - values[k - window]
+        out[k] = total / window
+
+    return out
+
+
+def rolling_mean_matrix(matrix: np.ndarray, window: int) -> np.ndarray:
+    """Column-wise rolling mean over a (T, C) matrix in one cumsum pass.
+
+    Matches pandas' rolling().mean() shape: the first ``window - 1``
+    rows are NaN.
+    """
+    out = np.full(matrix.shape, np.nan, dtype=np.float64)
+    if window <= 0 or matrix.shape[0] < window:
+        return out
+
+    cumulative = np.cumsum(matrix, axis=0, dtype=np.float64)
+    out[window - 1] = cumulative[window - 1] / window
+    out[window:] = (cumulative[window:] - cumulative[:-window]) / window
+    return out
+
+
+if _HAVE_NUMBA:
+    pearson_matrix = njit(parallel=True, cache=True)(_pearson_matrix_loops)
+    rolling_mean = njit(cache=True)(_rolling_mean_loops)
+else:
+    pearson_matrix = _pearson_matrix_numpy
+    rolling_mean = _rolling_mean_numpy
@@ -1,13 +1,263 @@
 """Web dashboard for explanation visualization."""
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import streamlit as st
-import plotly.graph_objects as go
+from streamlit import runtime
 from datetime import datetime, timedelta
-from typing import List, Optional, Sequence
+from typing import (
+    TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+)
 
-from .explanation_visualizer import ExplanationVisualizer
 from ..core.explainability import ExplainabilityEngine, Explanation
 
+if TYPE_CHECKING:
+    from .explanation_visualizer import ExplanationVisualizer
+
+# Shared Plotly render config; the modebar adds client-side JS cost to
+# every chart and is not useful in this dashboard
+CHART_CONFIG = {"displayModeBar": False, "responsive": True}
+
+# Plotly slows sharply past a few thousand points; larger sets are
+# uniformly sampled down to this size unless the user opts out
+_MAX_POINTS = 5000
+
+# Sidebar time windows in the order they are offered
+_WINDOW_MAP = {
+    "1 hour": timedelta(hours=1),
+    "24 hours": timedelta(days=1),
+    "7 days": timedelta(days=7),
+    "30 days": timedelta(days=30),
+    "All time": None
+}
+
+
+@st.cache_resource
+def _get_visualizer() -> "ExplanationVisualizer":
+    """Process-wide default visualizer, shared across reruns.
+
+    The visualizer holds no per-session state, so one instance serves
+    every session instead of being rebuilt on each dashboard rerun.
+    """
+    from .explanation_visualizer import ExplanationVisualizer
+    return ExplanationVisualizer()
+
+
+@st.cache_resource
+def _prefetch_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for warming caches in the background."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+
+def _fragment(func):
+    """Run a render helper as a Streamlit fragment when possible.
+
+    Fragments rerun in isolation, so a slider inside one no longer
+    triggers a full-script rerun. Outside a running app (tests, bare
+    scripts) st.fragment skips the body entirely, so fall back to a
+    plain call there.
+    """
+    fragment_func = st.fragment(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if runtime.exists():
+            return fragment_func(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _fingerprint(explanations: Sequence[Explanation]) -> tuple:
+    """Build a cheap, hashable identity for an explanation list."""
+    if not explanations:
+        return (0, "", "")
+    last = explanations[-1]
+    return (
+        len(explanations),
+        str(getattr(last, "decision_id", "")),
+        str(getattr(last, "timestamp", ""))
+    )
+
+
+@st.cache_data(max_entries=32)
+def _project_soa(
+    _explanations: Sequence[Explanation],
+    fp: tuple
+) -> Dict[str, Any]:
+    """Project an explanation list into structure-of-arrays form.
+
+    One pass over the objects replaces the per-chart attribute walks:
+    scalar fields land in dense NumPy arrays and factor scores in one
+    NaN-padded array per factor name. Cached per fingerprint so every
+    chart on a page shares the same projection.
+
+    Returns:
+        Dict with ``confidence``, ``timestamp`` and ``n_steps`` arrays
+        plus ``factor_scores`` (name -> array) and ``factor_category``
+        (name -> category) mappings.
+    """
+    count = len(_explanations)
+    confidence = np.empty(count, dtype=np.float32)
+    timestamp = np.empty(count, dtype="datetime64[ns]")
+    n_steps = np.empty(count, dtype=np.int32)
+    factor_scores: Dict[str, np.ndarray] = {}
+    factor_category: Dict[str, str] = {}
+
+    for row, exp in enumerate(_explanations):
+        confidence[row] = exp.confidence
+        timestamp[row] = np.datetime64(exp.timestamp)
+        n_steps[row] = len(exp.reasoning_steps)
+        for name, factor in exp.context_influence.items():
+            scores = factor_scores.get(name)
+            if scores is None:
+                scores = np.full(count, np.nan, dtype=np.float32)
+                factor_scores[name] = scores
+                factor_category[name] = factor.category
+            scores[row] = factor.influence_score
+
+    # Encode categories as small ints so reductions stay in NumPy
+    category_to_id: Dict[str, int] = {}
+    category_ids = np.fromiter(
+        (
+            category_to_id.setdefault(category, len(category_to_id))
+            for category in factor_category.values()
+        ),
+        dtype=np.uint16,
+        count=len(factor_category)
+    )
+
+    return {
+        "confidence": confidence,
+        "timestamp": timestamp,
+        "n_steps": n_steps,
+        "factor_scores": factor_scores,
+        "factor_category": factor_category,
+        "category_ids": category_ids
+    }
+
+
+@st.cache_data(max_entries=32)
+def _overview_stats(
+    _explanations: Sequence[Explanation],
+    fp: tuple
+) -> Tuple[int, float, int, float]:
+    """Compute the overview metrics from the shared SoA projection.
+
+    Returns:
+        Tuple of (total decisions, average confidence, unique category
+        count, average reasoning steps).
+    """
+    soa = _project_soa(_explanations, fp)
+    if not soa["confidence"].size:
+        return (0, 0.0, 0, 0.0)
+
+    return (
+        int(soa["confidence"].size),
+        float(soa["confidence"].mean()),
+        int(np.unique(soa["category_ids"]).size),
+        float(soa["n_steps"].mean())
+    )
+
+
+@st.cache_resource(max_entries=64)
+def _cached_figure_json(_visualizer, _explanations, fp, method, *params):
+    """Build a figure once per (fingerprint, method, params) key.
+
+    The visualizer and explanation list are excluded from the cache key;
+    ``fp`` stands in for the data so repeated reruns with unchanged
+    explanations skip Plotly trace construction entirely. Figures are
+    cached in pre-serialized plotly-JSON form so the cached path also
+    skips the per-trace serialization walk on rerender.
+    """
+    fig = getattr(_visualizer, method)(_explanations, *params)
+    to_json = getattr(fig, "to_plotly_json", None)
+    return to_json() if callable(to_json) else fig
+
+
+@st.cache_resource(max_entries=16)
+def _overview_figures(_visualizer, _explanations, fp):
+    """Build the three overview figures as one cached batch.
+
+    A single cache entry per fingerprint covers the whole page, so an
+    overview rerun is one lookup instead of three.
+    """
+    return (
+        _visualizer.create_confidence_distribution(_explanations),
+        _visualizer.create_factor_importance_trend(_explanations),
+        _visualizer.create_outcome_analysis(_explanations)
+    )
+
+
+@st.cache_data(max_entries=32)
+def _explanation_labels(
+    _explanations: Sequence[Explanation],
+    fp: tuple
+) -> Tuple[List[str], List[str]]:
+    """Precompute selectbox labels once per fingerprint.
+
+    format_func runs for every option on every rerun, so the per-option
+    strftime/format work is hoisted here and reruns reduce to list
+    indexing.
+
+    Returns:
+        Tuple of (long labels with confidence, short labels) aligned
+        with the explanation list.
+    """
+    long_labels = []
+    short_labels = []
+    for exp in _explanations:
+        stamp = exp.timestamp.strftime('%Y-%m-%d %H:%M:%S')
+        short = f"{exp.decision_id} - {stamp}"
+        short_labels.append(short)
+        long_labels.append(f"{short} - Confidence: {exp.confidence:.1%}")
+    return long_labels, short_labels
+
+
+@st.cache_resource(max_entries=8)
+def _all_factor_distributions(_visualizer, _explanations, fp):
+    """Build every factor's value-distribution figure in one batch.
+
+    Precomputing the whole set per fingerprint makes switching factors
+    in the selector a dict lookup instead of an O(N) re-scan.
+    """
+    names = set()
+    for exp in _explanations:
+        names.update(exp.context_influence.keys())
+    return {
+        name: _visualizer.create_factor_value_distribution(
+            _explanations, name
+        )
+        for name in names
+    }
+
+
+@st.cache_resource(max_entries=16)
+def _cached_comparison(_visualizer, _exp1, _exp2, fp, idx1, idx2):
+    """Build a comparison figure once per (fingerprint, index pair).
+
+    Reopening a previously viewed comparison hits the cache instead of
+    rebuilding the figure.
+    """
+    return _visualizer.create_decision_comparison(_exp1, _exp2)
+
+
+@st.cache_data(ttl=60, max_entries=16)
+def _filter_cached(
+    _engine: ExplainabilityEngine,
+    engine_version: int,
+    window_seconds: Optional[float]
+) -> List[Explanation]:
+    """Filter explanations by window, cached per engine version.
+
+    The engine itself is excluded from the cache key (leading underscore);
+    ``engine_version`` stands in for it, so recording a new explanation
+    invalidates the cache automatically.
+    """
+    return _engine._filter_explanations_by_time(window_seconds)
+
 
 class ExplanationDashboard:
     """Web dashboard for visualizing and analyzing explanations."""
@@ -15,11 +265,22 @@ class ExplanationDashboard:
     def __init__(
         self,
         engine: ExplainabilityEngine,
-        visualizer: Optional[ExplanationVisualizer] = None
+        visualizer: Optional["ExplanationVisualizer"] = None
     ):
         """Initialize the dashboard."""
         self.engine = engine
-        self.visualizer = visualizer or ExplanationVisualizer()
+        self._visualizer = visualizer
+
+    @property
+    def visualizer(self) -> "ExplanationVisualizer":
+        """Default visualizer, constructed lazily on first use.
+
+        Deferring the import keeps plotly, pandas and networkx off the
+        dashboard's cold-start path when a visualizer is injected.
+        """
+        if self._visualizer is None:
+            self._visualizer = _get_visualizer()
+        return self._visualizer
 
     def run(self):
         """Run the dashboard."""
@@ -40,6 +301,9 @@ class ExplanationDashboard:
         # Get filtered explanations
         explanations = self._get_filtered_explanations(time_window)
 
+        # Warm the cache for the neighboring windows while the user reads
+        self._prefetch_neighbors(time_window)
+
         # Show comparison if active
         self._show_comparison(explanations)
 
@@ -58,93 +322,158 @@ class ExplanationDashboard:
         time_window: str
     ) -> List[Explanation]:
         """Get explanations filtered by time window."""
-        window_map = {
-            "1 hour": timedelta(hours=1),
-            "24 hours": timedelta(days=1),
-            "7 days": timedelta(days=7),
-            "30 days": timedelta(days=30),
-            "All time": None
-        }
-
-        return self.engine._filter_explanations_by_time(
+        return _filter_cached(
+            self.engine,
+            getattr(self.engine, "version", 0),
             None if time_window == "All time"
-            else window_map[time_window].total_seconds()
+            else _WINDOW_MAP[time_window].total_seconds()
         )
 
-    def _show_overview(self, explanations: List[Explanation]):
-        """Show overview metrics."""
-        col1, col2, col3, col4 = st.columns(4)
+    def _prefetch_neighbors(self, time_window: str) -> None:
+        """Warm the filter cache for windows adjacent to the current one.
 
-        with col1:
-            st.metric(
-                "Total Decisions",
-                len(explanations)
-            )
+        Users typically step through neighboring windows, so fetching
+        them in the background makes the next switch hit the cache.
+        """
+        order = list(_WINDOW_MAP)
+        try:
+            index = order.index(time_window)
+        except ValueError:
+            return
 
-        with col2:
-            avg_confidence = sum(
-                exp.confidence for exp in explanations
-            ) / len(explanations) if explanations else 0
-            st.metric(
-                "Average Confidence",
-                f"{avg_confidence:.1%}"
+        executor = _prefetch_executor()
+        version = getattr(self.engine, "version", 0)
+        neighbors = order[max(index - 1, 0):index] + order[index + 1:index + 2]
+        for neighbor in neighbors:
+            delta = _WINDOW_MAP[neighbor]
+            executor.submit(
+                self._prefetch_window,
+                version,
+                None if delta is None else delta.total_seconds()
             )
 
-        with col3:
-            unique_categories = len({
-                factor.category
-                for exp in explanations
-                for factor in exp.context_influence.values()
-            })
-            st.metric("Unique Categories", unique_categories)
-
-        with col4:
-            avg_steps = sum(
-                len(exp.reasoning_steps) for exp in explanations
-            ) / len(explanations) if explanations else 0
-            st.metric(
-                "Avg Reasoning Steps",
-                f"{avg_steps:.1f}"
-            )
+    def _prefetch_window(
+        self,
+        version: int,
+        seconds: Optional[float]
+    ) -> None:
+        """Best-effort cache warm for one window; errors are swallowed."""
+        try:
+            _filter_cached(self.engine, version, seconds)
+        except Exception:
+            pass
+
+    def _chart(self, explanations: List[Explanation], method: str, *params):
+        """Build or fetch a cached figure for an explanation list."""
+        payload = _cached_figure_json(
+            self.visualizer,
+            explanations,
+            _fingerprint(explanations),
+            method,
+            *params
+        )
+        if isinstance(payload, dict):
+            import plotly.graph_objects as go
+            return go.Figure(payload, skip_invalid=True)
+        return payload
+
+    def _show_overview(self, explanations: List[Explanation]):
+        """Show overview metrics."""
+        self._show_overview_metrics(explanations)
+
+        if not explanations:
+            st.info("No explanations match the selected filters.")
+            return
+
+        fig_confidence, fig_trend, fig_outcomes = _overview_figures(
+            self.visualizer, explanations, _fingerprint(explanations)
+        )
 
         # Add confidence distribution
         st.subheader("Confidence Distribution")
         st.plotly_chart(
-            self.visualizer.create_confidence_distribution(explanations),
-            use_container_width=True
+            fig_confidence,
+            use_container_width=True,
+            theme=None,
+            config=CHART_CONFIG
         )
 
         # Add factor importance trend
         st.subheader("Factor Importance Over Time")
         st.plotly_chart(
-            self.visualizer.create_factor_importance_trend(explanations),
-            use_container_width=True
+            fig_trend,
+            use_container_width=True,
+            theme=None,
+            config=CHART_CONFIG
         )
 
         # Add outcome analysis
         st.subheader("Decision Outcomes")
         st.plotly_chart(
-            self.visualizer.create_outcome_analysis(explanations),
-            use_container_width=True
+            fig_outcomes,
+            use_container_width=True,
+            theme=None,
+            config=CHART_CONFIG
         )
 
+    def _show_overview_metrics(self, explanations: List[Explanation]):
+        """Show the headline metric row for an explanation set."""
+        total, avg_confidence, unique_categories, avg_steps = _overview_stats(
+            explanations,
+            _fingerprint(explanations)
+        )
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Total Decisions", total)
+        col2.metric("Average Confidence", f"{avg_confidence:.1%}")
+        col3.metric("Unique Categories", unique_categories)
+        col4.metric("Avg Reasoning Steps", f"{avg_steps:.1f}")
+
+    def _downsample(
+        self,
+        explanations: List[Explanation]
+    ) -> List[Explanation]:
+        """Uniformly sample a large explanation list for charting."""
+        if len(explanations) <= _MAX_POINTS:
+            return explanations
+
+        if st.checkbox("Show all points (slow)", value=False):
+            return explanations
+
+        indices = np.linspace(
+            0, len(explanations) - 1, _MAX_POINTS
+        ).astype(np.int64)
+        return [explanations[i] for i in indices]
+
     def _show_timeline(self, explanations: List[Explanation]):
         """Show timeline visualization."""
         st.header("Decision Timeline")
 
+        if not explanations:
+            st.info("No explanations match the selected filters.")
+            return
+
+        explanations = self._downsample(explanations)
+
         st.plotly_chart(
-            self.visualizer.create_decision_timeline(explanations),
-            use_container_width=True
+            self._chart(explanations, "create_decision_timeline"),
+            use_container_width=True,
+            theme=None,
+            config=CHART_CONFIG
         )
 
     def _show_correlations(self, explanations: List[Explanation]):
         """Show correlation analysis."""
         st.header("Factor Correlations")
 
-        if len(explanations) < 2:
-            st.warning("Need at least 2 explanations for correlation analysis.")
+        # Pairwise correlations on fewer than 3 points are always +/-1,
+        # so the heatmap carries no signal below that
+        if len(explanations) < 3:
+            st.warning("Need at least 3 explanations for correlation analysis.")
             return
 
+        explanations = self._downsample(explanations)
+
         tab1, tab2, tab3 = st.tabs([
             "Correlation Heatmap",
             "Category Evolution",
@@ -152,31 +481,64 @@ class ExplanationDashboard:
         ])
 
         with tab1:
-            st.plotly_chart(
-                self.visualizer.create_factor_correlation_heatmap(explanations),
-                use_container_width=True
-            )
+            self._render_heatmap_tab(explanations)
 
         with tab2:
+            self._render_evolution_tab(explanations)
+
+        with tab3:
+            self._render_category_comparison_tab(explanations)
+
+    @_fragment
+    def _render_heatmap_tab(self, explanations: List[Explanation]):
+        """Render the correlation heatmap tab."""
+        st.plotly_chart(
+            self._chart(explanations, "create_factor_correlation_heatmap"),
+            use_container_width=True,
+            theme=None,
+            config=CHART_CONFIG
+        )
+
+    @_fragment
+    def _render_evolution_tab(self, explanations: List[Explanation]):
+        """Render the category evolution tab with its window slider.
+
+        The slider sits in a form so dragging it does not recompute the
+        rolling evolution on every tick; only pressing Apply does.
+        """
+        with st.form("evolution_window_form"):
             window_size = st.slider(
                 "Trend Window Size",
                 min_value=2,
                 max_value=50,
-                value=10
-            )
-            st.plotly_chart(
-                self.visualizer.create_category_evolution(
-                    explanations,
-                    window_size=window_size
-                ),
-                use_container_width=True
+                value=st.session_state.get("window_size_applied", 10)
             )
+            submitted = st.form_submit_button("Apply")
 
-        with tab3:
-            st.plotly_chart(
-                self.visualizer.create_category_comparison(explanations),
-                use_container_width=True
-            )
+        if submitted:
+            st.session_state.window_size_applied = window_size
+        window_size = st.session_state.get("window_size_applied", window_size)
+
+        st.plotly_chart(
+            self._chart(
+                explanations,
+                "create_category_evolution",
+                window_size
+            ),
+            use_container_width=True,
+            theme=None,
+            config=CHART_CONFIG
+        )
+
+    @_fragment
+    def _render_category_comparison_tab(self, explanations: List[Explanation]):
+        """Render the category comparison tab."""
+        st.plotly_chart(
+            self._chart(explanations, "create_category_comparison"),
+            use_container_width=True,
+            theme=None,
+            config=CHART_CONFIG
+        )
 
     def _show_detailed_analysis(self, explanations: List[Explanation]):
         """Show detailed analysis for a single explanation."""
@@ -185,16 +547,15 @@ class ExplanationDashboard:
             return
 
         # Add explanation selector
+        labels, _ = _explanation_labels(
+            explanations, _fingerprint(explanations)
+        )
         col1, col2 = st.columns([3, 1])
         with col1:
             selected_index = st.selectbox(
                 "Select Explanation",
                 range(len(explanations)),
-                format_func=lambda i: (
-                    f"{explanations[i].decision_id} - "
-                    f"{explanations[i].timestamp.strftime('%Y-%m-%d %H:%M:%S')} - "
-                    f"Confidence: {explanations[i].confidence:.1%}"
-                )
+                format_func=lambda i: labels[i]
             )
         with col2:
             st.button(
@@ -218,61 +579,105 @@ class ExplanationDashboard:
         ])
 
         with tab1:
-            # Add top-n selector
+            self._render_influence_tab(explanation)
+
+        with tab2:
+            self._render_flow_tab(explanation)
+
+        with tab3:
+            self._render_factor_values_tab(explanations, explanation)
+
+        with tab4:
+            self._render_raw_data_tab(explanation)
+
+    @_fragment
+    def _render_influence_tab(self, explanation: Explanation):
+        """Render the context influence tab with its top-n slider.
+
+        Like the evolution window, the slider is debounced behind a
+        form so the chart rebuilds once per applied value.
+        """
+        with st.form("influence_top_n_form"):
             top_n = st.slider(
                 "Number of top factors to show",
                 min_value=3,
                 max_value=10,
-                value=5
+                value=st.session_state.get("top_n_applied", 5)
             )
+            submitted = st.form_submit_button("Apply")
+
+        if submitted:
+            st.session_state.top_n_applied = top_n
+        top_n = st.session_state.get("top_n_applied", top_n)
+
+        st.plotly_chart(
+            self.visualizer.create_influence_chart(
+                explanation,
+                top_n=top_n
+            ),
+            use_container_width=True,
+            theme=None,
+            config=CHART_CONFIG
+        )
+
+    @_fragment
+    def _render_flow_tab(self, explanation: Explanation):
+        """Render the decision flow tab."""
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("Network Graph")
             st.plotly_chart(
-                self.visualizer.create_influence_chart(
-                    explanation,
-                    top_n=top_n
-                ),
-                use_container_width=True
+                self.visualizer.create_decision_flow(explanation),
+                use_container_width=True,
+                theme=None,
+                config=CHART_CONFIG
+            )
+        with col2:
+            st.subheader("Sankey Diagram")
+            st.plotly_chart(
+                self.visualizer.create_decision_sankey(explanation),
+                use_container_width=True,
+                theme=None,
+                config=CHART_CONFIG
             )
 
-        with tab2:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.subheader("Network Graph")
-                st.plotly_chart(
-                    self.visualizer.create_decision_flow(explanation),
-                    use_container_width=True
-                )
-            with col2:
-                st.subheader("Sankey Diagram")
-                st.plotly_chart(
-                    self.visualizer.create_decision_sankey(explanation),
-                    use_container_width=True
-                )
+    @_fragment
+    def _render_factor_values_tab(
+        self,
+        explanations: List[Explanation],
+        explanation: Explanation
+    ):
+        """Render the factor values tab with its factor selector."""
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            # Add factor selector
+            factor_name = st.selectbox(
+                "Select Factor",
+                options=list(explanation.context_influence.keys())
+            )
+            # Add factor details
+            factor = explanation.context_influence[factor_name]
+            st.metric("Influence Score", f"{factor.influence_score:.1%}")
+            st.metric("Confidence", f"{factor.confidence:.1%}")
+            st.metric("Category", factor.category)
 
-        with tab3:
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                # Add factor selector
-                factor_name = st.selectbox(
-                    "Select Factor",
-                    options=list(explanation.context_influence.keys())
-                )
-                # Add factor details
-                factor = explanation.context_influence[factor_name]
-                st.metric("Influence Score", f"{factor.influence_score:.1%}")
-                st.metric("Confidence", f"{factor.confidence:.1%}")
-                st.metric("Category", factor.category)
-
-            with col2:
-                st.plotly_chart(
-                    self.visualizer.create_factor_value_distribution(
-                        explanations,
-                        factor_name
-                    ),
-                    use_container_width=True
-                )
+        with col2:
+            figures = _all_factor_distributions(
+                self.visualizer,
+                explanations,
+                _fingerprint(explanations)
+            )
+            st.plotly_chart(
+                figures[factor_name],
+                use_container_width=True,
+                theme=None,
+                config=CHART_CONFIG
+            )
 
-        with tab4:
-            st.json(self.engine.visualize_explanation(explanation.decision_id))
+    @_fragment
+    def _render_raw_data_tab(self, explanation: Explanation):
+        """Render the raw explanation JSON tab."""
+        st.json(self.engine.visualize_explanation(explanation.decision_id))
 
     def _show_comparison_dialog(
         self,
@@ -285,32 +690,47 @@ class ExplanationDashboard:
 
     def _show_comparison(self, explanations: List[Explanation]):
         """Show comparison between two decisions."""
-        if not hasattr(st.session_state, 'show_comparison'):
+        if not st.session_state.get('show_comparison'):
             return
 
-        if st.session_state.show_comparison:
-            with st.sidebar:
-                st.subheader("Decision Comparison")
-
-                # Add second explanation selector
-                selected_index2 = st.selectbox(
-                    "Compare with",
-                    range(len(explanations)),
-                    format_func=lambda i: (
-                        f"{explanations[i].decision_id} - "
-                        f"{explanations[i].timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-                    )
-                )
-
-                if st.button("Close Comparison"):
-                    st.session_state.show_comparison = False
-                    return
-
-                # Show comparison visualization
-                st.plotly_chart(
-                    self.visualizer.create_decision_comparison(
-                        explanations[st.session_state.comparison_index1],
-                        explanations[selected_index2]
-                    ),
-                    use_container_width=True
-                )
+        self._render_comparison(explanations)
+
+    @_fragment
+    def _render_comparison(self, explanations: List[Explanation]):
+        """Render the sidebar comparison panel.
+
+        Runs as a fragment so changing the comparison target reruns only
+        this panel, not the main-page charts.
+        """
+        with st.sidebar:
+            st.subheader("Decision Comparison")
+
+            # Add second explanation selector
+            _, short_labels = _explanation_labels(
+                explanations, _fingerprint(explanations)
+            )
+            selected_index2 = st.selectbox(
+                "Compare with",
+                range(len(explanations)),
+                format_func=lambda i: short_labels[i]
+            )
+
+            if st.button("Close Comparison"):
+                st.session_state.show_comparison = False
+                return
+
+            # Show comparison visualization
+            index1 = st.session_state.comparison_index1
+            st.plotly_chart(
+                _cached_comparison(
+                    self.visualizer,
+                    explanations[index1],
+                    explanations[selected_index2],
+                    _fingerprint(explanations),
+                    index1,
+                    selected_index2
+                ),
+                use_container_width=True,
+                theme=None,
+                config=CHART_CONFIG
+            )
@@ -10,15 +10,50 @@ Typical usage example:
     chart.show()
 """
 
+import heapq
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from typing import List, Optional, Tuple, Dict, Any, Union
+import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-import networkx as nx
+from scipy.ndimage import gaussian_filter
+from scipy.stats import gaussian_kde
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
 from datetime import datetime, timedelta
 
-from ..core.explainability import Explanation, ContextFactor
+from ..core.explainability import Explanation
+from ._kernels import factor_matrix, pearson_matrix, rolling_mean_matrix
+from ._layout import fr_layout
+
+# Upper bound on memoized figures kept per visualizer instance
+_FIGURE_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=128)
+def _cached_layout(
+    n_nodes: int,
+    edges_src: tuple,
+    edges_dst: tuple
+) -> np.ndarray:
+    """Memoized force-directed layout keyed by graph signature.
+
+    Recurring decision flows produce identical node/edge structures,
+    so the iterative relaxation only runs once per distinct graph.
+    """
+    return fr_layout(
+        n_nodes,
+        np.array(edges_src, dtype=np.int64),
+        np.array(edges_dst, dtype=np.int64)
+    )
 
 
 class ExplanationVisualizer:
@@ -36,9 +71,147 @@ class ExplanationVisualizer:
         create_decision_flow: Creates a network graph of the decision process.
         create_factor_correlation_heatmap: Creates a correlation matrix heatmap.
         create_decision_timeline: Creates a timeline visualization.
+        to_json: Serializes a figure to JSON; prefer this over
+            fig.to_json() when transporting large figures.
         ...
     """
 
+    def __init__(self):
+        """Initialize the visualizer with empty figure and SoA caches."""
+        self._figure_cache: Dict[tuple, go.Figure] = {}
+        self._soa_cache: Dict[tuple, pd.DataFrame] = {}
+        self._sorted_cache: Dict[tuple, tuple] = {}
+        self._slice_cache: Dict[tuple, List[Explanation]] = {}
+
+    @staticmethod
+    def _fingerprint(explanations: List[Explanation]) -> tuple:
+        """Build a cheap, hashable identity for an explanation list."""
+        if not explanations:
+            return (0, "", "")
+        last = explanations[-1]
+        return (
+            len(explanations),
+            str(last.decision_id),
+            str(last.timestamp)
+        )
+
+    def _store_figure(self, key: tuple, fig: go.Figure) -> go.Figure:
+        """Memoize a figure, evicting the oldest entry when full."""
+        if len(self._figure_cache) >= _FIGURE_CACHE_SIZE:
+            self._figure_cache.pop(next(iter(self._figure_cache)))
+        self._figure_cache[key] = fig
+        return fig
+
+    @staticmethod
+    def to_json(fig: go.Figure) -> str:
+        """Serialize a figure to a JSON string.
+
+        Uses orjson when available, which writes numeric arrays in
+        native code and serializes NumPy arrays without the .tolist()
+        copy that plotly's default encoder makes; falls back to
+        fig.to_json() otherwise.
+
+        Args:
+            fig: The figure to serialize.
+
+        Returns:
+            str: JSON representation of the figure.
+        """
+        if orjson is None:
+            return fig.to_json()
+        return orjson.dumps(
+            fig.to_dict(), option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def _window_slice(
+        self,
+        explanations: List[Explanation],
+        window: Optional[timedelta]
+    ) -> List[Explanation]:
+        """Filter to a trailing time window with a searchsorted seek.
+
+        A chronologically sorted view plus a datetime64 timestamp
+        array is cached per fingerprint, so the cutoff point is found
+        in O(log N) and returned as a slice instead of a full linear
+        scan per call.
+        """
+        if not window or not explanations:
+            return explanations
+
+        key = self._fingerprint(explanations)
+
+        # The cutoff is quantized to whole seconds so back-to-back
+        # renders of the same dashboard hit a plain dict lookup
+        cutoff = datetime.now() - window
+        slice_key = (key, window, cutoff.replace(microsecond=0))
+        memoized = self._slice_cache.get(slice_key)
+        if memoized is not None:
+            return memoized
+
+        cached = self._sorted_cache.get(key)
+        if cached is None:
+            sorted_exps = sorted(explanations, key=lambda e: e.timestamp)
+            timestamps = np.fromiter(
+                (np.datetime64(exp.timestamp) for exp in sorted_exps),
+                dtype='datetime64[us]',
+                count=len(sorted_exps)
+            )
+            cached = (sorted_exps, timestamps)
+            if len(self._sorted_cache) >= _FIGURE_CACHE_SIZE:
+                self._sorted_cache.pop(next(iter(self._sorted_cache)))
+            self._sorted_cache[key] = cached
+
+        sorted_exps, timestamps = cached
+        start = int(np.searchsorted(timestamps, np.datetime64(cutoff)))
+        window_exps = sorted_exps[start:]
+
+        if len(self._slice_cache) >= _FIGURE_CACHE_SIZE:
+            self._slice_cache.pop(next(iter(self._slice_cache)))
+        self._slice_cache[slice_key] = window_exps
+        return window_exps
+
+    def _materialize(self, explanations: List[Explanation]) -> pd.DataFrame:
+        """Flatten explanations into a cached factor-level table.
+
+        One walk over the objects produces columns (exp_idx,
+        factor_name, category, influence_score, confidence) that every
+        aggregation method can scan as contiguous arrays instead of
+        chasing per-factor attributes.
+        """
+        key = self._fingerprint(explanations)
+        cached = self._soa_cache.get(key)
+        if cached is not None:
+            return cached
+
+        records = chain.from_iterable(
+            (
+                (
+                    idx,
+                    name,
+                    factor.category,
+                    factor.influence_score,
+                    factor.confidence
+                )
+                for name, factor in exp.context_influence.items()
+            )
+            for idx, exp in enumerate(explanations)
+        )
+        df = pd.DataFrame.from_records(
+            records,
+            columns=[
+                'exp_idx',
+                'factor_name',
+                'category',
+                'influence_score',
+                'confidence'
+            ]
+        )
+
+        if len(self._soa_cache) >= _FIGURE_CACHE_SIZE:
+            self._soa_cache.pop(next(iter(self._soa_cache)))
+        self._soa_cache[key] = df
+        return df
+
     def create_influence_chart(
         self,
         explanation: Explanation,
@@ -64,12 +237,24 @@ class ExplanationVisualizer:
         if not explanation.context_influence:
             raise ValueError("Explanation has no context factors")
 
-        # Sort factors by influence score
-        factors = sorted(
+        cache_key = (
+            'influence_chart',
+            str(explanation.decision_id),
+            len(explanation.context_influence),
+            top_n,
+            color_scale
+        )
+        cached = self._figure_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Keep only the top factors; nlargest maintains a top_n-sized
+        # heap instead of sorting every factor
+        factors = heapq.nlargest(
+            top_n,
             explanation.context_influence.items(),
-            key=lambda x: x[1].influence_score,
-            reverse=True
-        )[:top_n]
+            key=lambda x: x[1].influence_score
+        )
 
         # Create bar chart
         fig = go.Figure([
@@ -84,7 +269,8 @@ class ExplanationVisualizer:
                     "Category: %{customdata}<br>"
                     "<extra></extra>"
                 ),
-                customdata=[f[1].category for f in factors]
+                customdata=[f[1].category for f in factors],
+                _validate=False
             )
         ])
 
@@ -95,7 +281,7 @@ class ExplanationVisualizer:
             showlegend=False
         )
 
-        return fig
+        return self._store_figure(cache_key, fig)
 
     def create_confidence_trend(
         self,
@@ -111,30 +297,34 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Plotly figure object
         """
-        if window:
-            cutoff = datetime.now() - window
-            explanations = [
-                exp for exp in explanations
-                if exp.timestamp >= cutoff
-            ]
-
-        # Create dataframe
-        df = pd.DataFrame([
-            {
-                'timestamp': exp.timestamp,
-                'confidence': exp.confidence,
-                'decision_type': exp.metadata['decision_type']
-            }
-            for exp in explanations
-        ])
+        explanations = self._window_slice(explanations, window)
+
+        # Build typed columns directly so pandas skips dtype inference
+        count = len(explanations)
+        df = pd.DataFrame({
+            'timestamp': np.fromiter(
+                (np.datetime64(exp.timestamp) for exp in explanations),
+                dtype='datetime64[ns]',
+                count=count
+            ),
+            'confidence': np.fromiter(
+                (exp.confidence for exp in explanations),
+                dtype=np.float32,
+                count=count
+            ),
+            'decision_type': pd.Categorical([
+                exp.metadata['decision_type'] for exp in explanations
+            ])
+        })
 
-        # Create line plot
+        # Create line plot; WebGL rendering avoids one SVG node per point
         fig = px.line(
             df,
             x='timestamp',
             y='confidence',
             color='decision_type',
-            title='Confidence Trend Over Time'
+            title='Confidence Trend Over Time',
+            render_mode='webgl'
         )
 
         fig.update_layout(
@@ -157,23 +347,27 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Plotly figure object
         """
-        # Collect category data
-        categories = {}
-        for exp in explanations:
-            for factor in exp.context_influence.values():
-                if factor.category not in categories:
-                    categories[factor.category] = {
-                        'count': 0,
-                        'total_influence': 0
-                    }
-                categories[factor.category]['count'] += 1
-                categories[factor.category]['total_influence'] += factor.influence_score
+        cache_key = (
+            'category_distribution', self._fingerprint(explanations)
+        )
+        cached = self._figure_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Aggregate per category with one C-level groupby over the
+        # shared factor table
+        stats = self._materialize(explanations).groupby(
+            'category', sort=False
+        ).agg(
+            count=('influence_score', 'size'),
+            mean_influence=('influence_score', 'mean')
+        )
 
         # Create sunburst chart
         fig = go.Figure(go.Sunburst(
-            labels=list(categories.keys()),
-            parents=[''] * len(categories),
-            values=[data['count'] for data in categories.values()],
+            labels=stats.index.tolist(),
+            parents=[''] * len(stats),
+            values=stats['count'].to_numpy(),
             branchvalues='total',
             hovertemplate=(
                 "Category: %{label}<br>"
@@ -181,17 +375,15 @@ class ExplanationVisualizer:
                 "Avg Influence: %{customdata:.2%}<br>"
                 "<extra></extra>"
             ),
-            customdata=[
-                data['total_influence'] / data['count']
-                for data in categories.values()
-            ]
+            customdata=stats['mean_influence'].to_numpy(),
+            _validate=False
         ))
 
         fig.update_layout(
             title="Context Factor Category Distribution"
         )
 
-        return fig
+        return self._store_figure(cache_key, fig)
 
     def create_decision_flow(
         self,
@@ -205,28 +397,22 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Plotly figure object
         """
-        # Create nodes for steps
-        nodes = []
-        edges = []
-
-        # Add context nodes
-        for i, (name, factor) in enumerate(explanation.context_influence.items()):
-            nodes.append(f"Context: {name}")
-            edges.append(("Context", f"Context: {name}"))
-
-        # Add reasoning steps
-        for i, step in enumerate(explanation.reasoning_steps):
-            nodes.append(f"Step {i+1}: {step}")
-            if i == 0:
-                # Connect first step to all context factors
-                for node in nodes[:-1]:
-                    edges.append((node, f"Step {i+1}: {step}"))
-            else:
-                # Connect to previous step
-                edges.append((
-                    f"Step {i}: {explanation.reasoning_steps[i-1]}",
-                    f"Step {i+1}: {step}"
-                ))
+        # Context nodes first, built in one pass
+        context_nodes = [
+            f"Context: {name}" for name in explanation.context_influence
+        ]
+        step_nodes = [
+            f"Step {i+1}: {step}"
+            for i, step in enumerate(explanation.reasoning_steps)
+        ]
+        nodes = context_nodes + step_nodes
+
+        edges = [("Context", node) for node in context_nodes]
+        if step_nodes:
+            # First step fans in from every context factor; later steps
+            # chain to their predecessor.
+            edges.extend((node, step_nodes[0]) for node in context_nodes)
+            edges.extend(zip(step_nodes, step_nodes[1:]))
 
         # Create network graph
         return self._create_network_graph(nodes, edges)
@@ -245,72 +431,90 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Network graph visualization
         """
-        # Create graph
-        G = nx.DiGraph()
-        G.add_nodes_from(nodes)
-        G.add_edges_from(edges)
-
-        # Use spring layout for node positions
-        pos = nx.spring_layout(G)
-
-        # Extract node positions
-        node_x = []
-        node_y = []
-        for node in G.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-
-        # Create edges
-        edge_x = []
-        edge_y = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-
-        # Create figure
-        fig = go.Figure()
-
-        # Add edges
-        fig.add_trace(go.Scatter(
-            x=edge_x,
-            y=edge_y,
-            line=dict(width=0.5, color='#888'),
-            hoverinfo='none',
-            mode='lines'
-        ))
+        # Index every label (edges may reference labels outside nodes)
+        label_index: Dict[str, int] = {}
+        for label in nodes:
+            label_index.setdefault(label, len(label_index))
+        for source, target in edges:
+            label_index.setdefault(source, len(label_index))
+            label_index.setdefault(target, len(label_index))
+
+        edges_src = np.fromiter(
+            (label_index[source] for source, _ in edges),
+            dtype=np.int64,
+            count=len(edges)
+        )
+        edges_dst = np.fromiter(
+            (label_index[target] for _, target in edges),
+            dtype=np.int64,
+            count=len(edges)
+        )
 
-        # Add nodes
-        fig.add_trace(go.Scatter(
-            x=node_x,
-            y=node_y,
-            mode='markers+text',
-            hoverinfo='text',
-            text=nodes,
-            textposition="top center",
-            marker=dict(
-                showscale=True,
-                colorscale='YlGnBu',
-                size=10,
-                colorbar=dict(
-                    thickness=15,
-                    title='Node Connections',
-                    xanchor='left',
-                    titleside='right'
+        # Force-directed positions from the array kernel instead of
+        # nx.spring_layout's per-node Python loops; memoized on the
+        # graph signature so repeat renders skip the relaxation
+        pos = _cached_layout(
+            len(label_index), tuple(edges_src), tuple(edges_dst)
+        )
+        node_x = pos[:, 0]
+        node_y = pos[:, 1]
+
+        # Edge coordinates as one strided array: endpoint, endpoint,
+        # NaN separator. Fancy-indexing replaces the per-edge Python
+        # loop and dict lookups.
+        edge_xy = np.empty((len(edges) * 3, 2), dtype=np.float64)
+        edge_xy[0::3] = pos[edges_src]
+        edge_xy[1::3] = pos[edges_dst]
+        edge_xy[2::3] = np.nan
+        edge_x = edge_xy[:, 0]
+        edge_y = edge_xy[:, 1]
+
+        # Edge and node traces plus the full layout in one
+        # constructor call
+        fig = go.Figure(
+            data=[
+                go.Scatter(
+                    x=edge_x,
+                    y=edge_y,
+                    line=dict(width=0.5, color='#888'),
+                    hoverinfo='none',
+                    mode='lines',
+                    _validate=False
+                ),
+                go.Scatter(
+                    x=node_x,
+                    y=node_y,
+                    mode='markers+text',
+                    hoverinfo='text',
+                    text=nodes,
+                    textposition="top center",
+                    marker=dict(
+                        showscale=True,
+                        colorscale='YlGnBu',
+                        size=10,
+                        colorbar=dict(
+                            thickness=15,
+                            title=dict(
+                                text='Node Connections', side='right'
+                            ),
+                            xanchor='left'
+                        )
+                    ),
+                    _validate=False
+                )
+            ],
+            layout=dict(
+                title="Decision Flow Network",
+                showlegend=False,
+                hovermode='closest',
+                margin=dict(b=20, l=5, r=5, t=40),
+                xaxis=dict(
+                    showgrid=False, zeroline=False, showticklabels=False
+                ),
+                yaxis=dict(
+                    showgrid=False, zeroline=False, showticklabels=False
                 )
             )
-        ))
-
-        # Update layout
-        fig.update_layout(
-            title="Decision Flow Network",
-            showlegend=False,
-            hovermode='closest',
-            margin=dict(b=20, l=5, r=5, t=40),
-            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
         )
 
         return fig
@@ -327,38 +531,23 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Correlation heatmap
         """
-        # Collect all unique factors
-        all_factors = set()
-        for exp in explanations:
-            all_factors.update(exp.context_influence.keys())
-
-        # Create correlation matrix
-        factor_list = sorted(all_factors)
-        n_factors = len(factor_list)
-        correlations = np.zeros((n_factors, n_factors))
-
-        # Calculate correlations
-        for i, factor1 in enumerate(factor_list):
-            for j, factor2 in enumerate(factor_list):
-                if i == j:
-                    correlations[i][j] = 1.0
-                    continue
-
-                # Get influence scores for both factors
-                scores1 = []
-                scores2 = []
-                for exp in explanations:
-                    if (factor1 in exp.context_influence and
-                            factor2 in exp.context_influence):
-                        scores1.append(exp.context_influence[factor1].influence_score)
-                        scores2.append(exp.context_influence[factor2].influence_score)
-
-                # Calculate correlation if we have enough data
-                if len(scores1) > 1:
-                    correlations[i][j] = np.corrcoef(scores1, scores2)[0, 1]
-
-        # Create heatmap
-        fig = go.Figure(data=go.Heatmap(
+        cache_key = ('correlation_heatmap', self._fingerprint(explanations))
+        cached = self._figure_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Flatten scores into a dense matrix once, then run the pairwise
+        # correlation kernel over it instead of re-scanning explanations
+        # for every factor pair
+        matrix, factor_list = factor_matrix(explanations)
+        # Pairs with fewer than two shared observations or zero
+        # variance come back NaN/0 from the kernel; normalize both to
+        # 0 so the heatmap shows "no correlation" uniformly
+        correlations = np.nan_to_num(pearson_matrix(matrix), copy=False)
+
+        # Create heatmap as a dict trace to skip constructor validation
+        fig = go.Figure(data=[dict(
+            type='heatmap',
             z=correlations,
             x=factor_list,
             y=factor_list,
@@ -368,16 +557,14 @@ class ExplanationVisualizer:
             texttemplate='%{text}',
             textfont={"size": 10},
             hoverongaps=False
-        ))
-
-        fig.update_layout(
+        )], layout=dict(
             title="Context Factor Correlation Heatmap",
             xaxis_title="Factors",
             yaxis_title="Factors",
             height=800
-        )
+        ))
 
-        return fig
+        return self._store_figure(cache_key, fig)
 
     def create_decision_timeline(
         self,
@@ -393,38 +580,40 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Timeline visualization
         """
-        if window:
-            cutoff = datetime.now() - window
-            explanations = [
-                exp for exp in explanations
-                if exp.timestamp >= cutoff
-            ]
-
-        # Create timeline data
-        data = []
-        for exp in explanations:
-            # Get top factor
-            top_factor = max(
-                exp.context_influence.items(),
-                key=lambda x: x[1].influence_score
-            )
-
-            data.append({
-                'timestamp': exp.timestamp,
-                'decision_id': exp.decision_id,
-                'confidence': exp.confidence,
-                'top_factor': top_factor[0],
-                'factor_influence': top_factor[1].influence_score,
-                'decision_type': exp.metadata['decision_type']
-            })
-
-        df = pd.DataFrame(data)
-
-        # Create figure
-        fig = go.Figure()
+        explanations = self._window_slice(explanations, window)
+
+        # Build typed columns directly so pandas skips dtype inference
+        count = len(explanations)
+        top_factors = [exp.top_factor for exp in explanations]
+        df = pd.DataFrame({
+            'timestamp': np.fromiter(
+                (np.datetime64(exp.timestamp) for exp in explanations),
+                dtype='datetime64[ns]',
+                count=count
+            ),
+            'decision_id': [exp.decision_id for exp in explanations],
+            'confidence': np.fromiter(
+                (exp.confidence for exp in explanations),
+                dtype=np.float32,
+                count=count
+            ),
+            'top_factor': [name for name, _ in top_factors],
+            'factor_influence': np.fromiter(
+                (factor.influence_score for _, factor in top_factors),
+                dtype=np.float32,
+                count=count
+            ),
+            'decision_type': pd.Categorical([
+                exp.metadata['decision_type'] for exp in explanations
+            ])
+        })
 
-        # Add confidence line
-        fig.add_trace(go.Scatter(
+        # Build traces as plain dicts; for large point counts this skips
+        # the per-property validation pass of the go.Scatter constructor.
+        # scattergl renders through WebGL instead of one SVG node per
+        # marker, which is the documented Plotly bottleneck at scale.
+        traces = [dict(
+            type='scattergl',
             x=df['timestamp'],
             y=df['confidence'],
             mode='lines+markers',
@@ -437,20 +626,25 @@ class ExplanationVisualizer:
                 "<extra></extra>"
             ),
             customdata=df[['decision_id', 'top_factor']].values
-        ))
+        )]
 
         # Add decision type markers
         for decision_type in df['decision_type'].unique():
             mask = df['decision_type'] == decision_type
-            fig.add_trace(go.Scatter(
+            traces.append(dict(
+                type='scattergl',
                 x=df[mask]['timestamp'],
                 y=df[mask]['confidence'],
                 mode='markers',
+                # Skip per-marker stroke rendering
+                marker=dict(size=12, line=dict(width=0)),
                 name=decision_type,
-                marker=dict(size=12),
                 showlegend=True
             ))
 
+        fig = go.Figure()
+        fig.add_traces(traces)
+
         fig.update_layout(
             title="Decision Timeline",
             xaxis_title="Time",
@@ -472,87 +666,76 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Sankey diagram
         """
-        # Prepare nodes and links
-        nodes = []
-        links = []
-        node_indices = {}
-        current_index = 0
-
-        # Add context factors as source nodes
-        for name, factor in explanation.context_influence.items():
-            nodes.append({
-                "label": f"Factor: {name}",
-                "color": "blue"
-            })
-            node_indices[name] = current_index
-            current_index += 1
-
-        # Add reasoning steps as intermediate nodes
-        for i, step in enumerate(explanation.reasoning_steps):
-            nodes.append({
-                "label": f"Step {i+1}: {step}",
-                "color": "green"
-            })
-            node_indices[f"step_{i}"] = current_index
-            current_index += 1
-
-        # Add final decision node
-        nodes.append({
-            "label": "Decision",
-            "color": "red"
-        })
-        decision_index = current_index
-
-        # Create links from factors to first step
-        for name, factor in explanation.context_influence.items():
-            links.append({
-                "source": node_indices[name],
-                "target": node_indices["step_0"],
-                "value": factor.influence_score,
-                "color": "rgba(0,0,255,0.2)"
-            })
-
-        # Create links between steps
-        for i in range(len(explanation.reasoning_steps) - 1):
-            links.append({
-                "source": node_indices[f"step_{i}"],
-                "target": node_indices[f"step_{i+1}"],
-                "value": 1,
-                "color": "rgba(0,255,0,0.2)"
-            })
-
-        # Create link from last step to decision
-        last_step = len(explanation.reasoning_steps) - 1
-        if last_step >= 0:
-            links.append({
-                "source": node_indices[f"step_{last_step}"],
-                "target": decision_index,
-                "value": 1,
-                "color": "rgba(255,0,0,0.2)"
-            })
+        # Node indices follow construction order: factors, then steps,
+        # then the decision node
+        factors = explanation.context_influence
+        steps = explanation.reasoning_steps
+        n_factors = len(factors)
+        n_steps = len(steps)
+        first_step = n_factors
+        decision_index = n_factors + n_steps
+
+        # Build node labels and colors in one pass each
+        labels = [f"Factor: {name}" for name in factors]
+        labels.extend(f"Step {i+1}: {step}" for i, step in enumerate(steps))
+        labels.append("Decision")
+        node_colors = (
+            ["blue"] * n_factors + ["green"] * n_steps + ["red"]
+        )
 
-        # Create figure
-        fig = go.Figure(data=[go.Sankey(
+        # Preallocate link arrays and fill them in a single pass
+        # instead of a dict list plus one comprehension per field
+        n_links = n_factors + max(n_steps - 1, 0) + (1 if n_steps else 0)
+        sources = np.empty(n_links, dtype=np.int32)
+        targets = np.empty(n_links, dtype=np.int32)
+        values = np.empty(n_links, dtype=np.float32)
+        link_colors = []
+        pos = 0
+
+        # Links from factors to first step
+        for idx, factor in enumerate(factors.values()):
+            sources[pos] = idx
+            targets[pos] = first_step
+            values[pos] = factor.influence_score
+            link_colors.append("rgba(0,0,255,0.2)")
+            pos += 1
+
+        # Links between steps
+        for i in range(n_steps - 1):
+            sources[pos] = first_step + i
+            targets[pos] = first_step + i + 1
+            values[pos] = 1.0
+            link_colors.append("rgba(0,255,0,0.2)")
+            pos += 1
+
+        # Link from last step to decision
+        if n_steps:
+            sources[pos] = first_step + n_steps - 1
+            targets[pos] = decision_index
+            values[pos] = 1.0
+            link_colors.append("rgba(255,0,0,0.2)")
+
+        # Create figure from a dict trace, passing the arrays directly
+        fig = go.Figure(data=[dict(
+            type='sankey',
             node=dict(
                 pad=15,
                 thickness=20,
                 line=dict(color="black", width=0.5),
-                label=[node["label"] for node in nodes],
-                color=[node["color"] for node in nodes]
+                label=labels,
+                color=node_colors
             ),
             link=dict(
-                source=[link["source"] for link in links],
-                target=[link["target"] for link in links],
-                value=[link["value"] for link in links],
-                color=[link["color"] for link in links]
+                source=sources,
+                target=targets,
+                value=values,
+                color=link_colors
             )
-        )])
-
-        fig.update_layout(
+        )], layout=dict(
             title="Decision Flow (Sankey Diagram)",
             font_size=10,
             height=600
-        )
+        ))
 
         return fig
 
@@ -578,35 +761,37 @@ class ExplanationVisualizer:
                     factor_totals[name] = 0
                 factor_totals[name] += factor.influence_score
 
-        # Get top N factors
-        top_factors = sorted(
+        # Get top N factors without sorting the full tally
+        top_factors = heapq.nlargest(
+            top_n,
             factor_totals.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:top_n]
+            key=lambda x: x[1]
+        )
         top_factor_names = [f[0] for f in top_factors]
 
-        # Create timeline data
-        data = []
-        for exp in sorted(explanations, key=lambda x: x.timestamp):
-            row = {'timestamp': exp.timestamp}
-            for factor in top_factor_names:
-                if factor in exp.context_influence:
-                    row[factor] = exp.context_influence[factor].influence_score
-                else:
-                    row[factor] = 0
-            data.append(row)
+        # Fill a preallocated (n, top_n) array by index instead of
+        # building a dict per explanation and letting pandas infer dtypes
+        sorted_exps = sorted(explanations, key=lambda x: x.timestamp)
+        name_to_col = {name: i for i, name in enumerate(top_factor_names)}
+        values = np.zeros((len(sorted_exps), len(top_factor_names)),
+                          dtype=np.float32)
+        timestamps = np.empty(len(sorted_exps), dtype='datetime64[ns]')
 
-        df = pd.DataFrame(data)
+        for row, exp in enumerate(sorted_exps):
+            timestamps[row] = np.datetime64(exp.timestamp)
+            for name, factor in exp.context_influence.items():
+                col = name_to_col.get(name)
+                if col is not None:
+                    values[row, col] = factor.influence_score
 
-        # Create figure
+        # Add a dict trace per factor; dicts bypass go.Scatter's
+        # property validation on construction
         fig = go.Figure()
-
-        # Add line for each factor
-        for factor in top_factor_names:
-            fig.add_trace(go.Scatter(
-                x=df['timestamp'],
-                y=df[factor],
+        fig.add_traces([
+            dict(
+                type='scattergl',
+                x=timestamps,
+                y=values[:, col],
                 mode='lines+markers',
                 name=factor,
                 hovertemplate=(
@@ -614,7 +799,9 @@ class ExplanationVisualizer:
                     f"{factor}: %{{y:.2%}}<br>"
                     "<extra></extra>"
                 )
-            ))
+            )
+            for factor, col in name_to_col.items()
+        ])
 
         fig.update_layout(
             title="Factor Importance Trend",
@@ -673,21 +860,28 @@ class ExplanationVisualizer:
 
         df = pd.DataFrame(data).fillna(0)
 
-        # Calculate rolling averages
-        for col in df.columns:
-            if col != 'timestamp':
-                df[f'{col}_rolling'] = df[col].rolling(window=window_size).mean()
+        # Calculate rolling averages for every category in one
+        # cumulative-sum pass instead of a pandas rolling() per column
+        category_cols = [col for col in df.columns if col != 'timestamp']
+        if category_cols:
+            rolled = rolling_mean_matrix(
+                df[category_cols].to_numpy(dtype=np.float64),
+                window_size
+            )
+            df[[f'{col}_rolling' for col in category_cols]] = rolled
 
         # Create figure
         fig = go.Figure()
 
-        # Add area traces for each category
+        # Add area traces for each category as plain dicts
         categories = [col for col in df.columns if col != 'timestamp']
+        traces = []
         for category in categories:
             if category.endswith('_rolling'):
                 continue
 
-            fig.add_trace(go.Scatter(
+            traces.append(dict(
+                type='scatter',
                 x=df['timestamp'],
                 y=df[category],
                 name=category,
@@ -701,7 +895,8 @@ class ExplanationVisualizer:
             ))
 
             # Add rolling average line
-            fig.add_trace(go.Scatter(
+            traces.append(dict(
+                type='scatter',
                 x=df['timestamp'],
                 y=df[f'{category}_rolling'],
                 name=f'{category} (trend)',
@@ -709,6 +904,8 @@ class ExplanationVisualizer:
                 visible='legendonly'
             ))
 
+        fig.add_traces(traces)
+
         fig.update_layout(
             title="Category Influence Evolution",
             xaxis_title="Time",
@@ -737,8 +934,19 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Confidence distribution visualization
         """
-        # Get confidence values
-        confidences = [exp.confidence for exp in explanations]
+        cache_key = (
+            'confidence_distribution', self._fingerprint(explanations)
+        )
+        cached = self._figure_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Get confidence values without Python float boxing
+        confidences = np.fromiter(
+            (exp.confidence for exp in explanations),
+            dtype=np.float32,
+            count=len(explanations)
+        )
 
         # Create histogram and KDE
         fig = go.Figure()
@@ -754,30 +962,38 @@ class ExplanationVisualizer:
                 "Confidence: %{x:.1%}<br>"
                 "Density: %{y:.3f}<br>"
                 "<extra></extra>"
-            )
+            ),
+            _validate=False
         ))
 
-        # Add KDE (using numpy's histogram and gaussian_filter)
-        hist, bin_edges = np.histogram(
-            confidences,
-            bins=50,
-            density=True
-        )
-        bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-
-        from scipy.ndimage import gaussian_filter
-        smoothed = gaussian_filter(hist, sigma=1.5)
+        # Add a proper KDE on a fixed grid; gaussian_kde needs at least
+        # two distinct samples, so degenerate input falls back to the
+        # smoothed histogram
+        if confidences.size > 1 and np.ptp(confidences) > 0:
+            grid = np.linspace(
+                float(confidences.min()), float(confidences.max()), 256
+            )
+            density = gaussian_kde(confidences)(grid)
+        else:
+            hist, bin_edges = np.histogram(
+                confidences,
+                bins=50,
+                density=True
+            )
+            grid = (bin_edges[:-1] + bin_edges[1:]) / 2
+            density = gaussian_filter(hist, sigma=1.5)
 
         fig.add_trace(go.Scatter(
-            x=bin_centers,
-            y=smoothed,
+            x=grid,
+            y=density,
             name="KDE",
             line=dict(width=2),
             hovertemplate=(
                 "Confidence: %{x:.1%}<br>"
                 "Density: %{y:.3f}<br>"
                 "<extra></extra>"
-            )
+            ),
+            _validate=False
         ))
 
         # Add mean line
@@ -797,7 +1013,7 @@ class ExplanationVisualizer:
             bargap=0.1
         )
 
-        return fig
+        return self._store_figure(cache_key, fig)
 
     def create_category_comparison(
         self,
@@ -811,37 +1027,26 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Category comparison visualization
         """
-        # Collect category statistics
-        categories = {}
-        for exp in explanations:
-            for factor in exp.context_influence.values():
-                if factor.category not in categories:
-                    categories[factor.category] = {
-                        'count': 0,
-                        'total_influence': 0,
-                        'total_confidence': 0,
-                        'high_influence_count': 0  # Count of times influence > 0.5
-                    }
-
-                cat_stats = categories[factor.category]
-                cat_stats['count'] += 1
-                cat_stats['total_influence'] += factor.influence_score
-                cat_stats['total_confidence'] += factor.confidence
-                if factor.influence_score > 0.5:
-                    cat_stats['high_influence_count'] += 1
-
-        # Prepare data for visualization
-        data = []
-        for category, stats in categories.items():
-            data.append({
-                'Category': category,
-                'Average Influence': stats['total_influence'] / stats['count'],
-                'Average Confidence': stats['total_confidence'] / stats['count'],
-                'High Influence Rate': stats['high_influence_count'] / stats['count'],
-                'Usage Count': stats['count']
-            })
+        # Aggregate per category with one C-level groupby over the
+        # shared factor table
+        stats = self._materialize(explanations).groupby(
+            'category', sort=False
+        ).agg(
+            count=('influence_score', 'size'),
+            mean_influence=('influence_score', 'mean'),
+            mean_confidence=('confidence', 'mean'),
+            high_influence_rate=(
+                'influence_score', lambda s: (s > 0.5).mean()
+            )
+        )
 
-        df = pd.DataFrame(data)
+        df = pd.DataFrame({
+            'Category': stats.index,
+            'Average Influence': stats['mean_influence'].to_numpy(),
+            'Average Confidence': stats['mean_confidence'].to_numpy(),
+            'High Influence Rate': stats['high_influence_rate'].to_numpy(),
+            'Usage Count': stats['count'].to_numpy()
+        })
 
         # Create parallel coordinates plot
         fig = go.Figure(data=go.Parcoords(
@@ -870,7 +1075,8 @@ class ExplanationVisualizer:
                     label='Usage Count',
                     values=df['Usage Count']
                 )
-            ]
+            ],
+            _validate=False
         ))
 
         fig.update_layout(
@@ -928,21 +1134,31 @@ class ExplanationVisualizer:
                 "Influence: %{y:.2%}<br>"
                 "Confidence: %{marker.color:.2%}<br>"
                 "<extra></extra>"
-            )
+            ),
+            _validate=False
         ))
 
         # Add trend line if numeric values
-        if all(isinstance(v, (int, float)) for v in values):
-            z = np.polyfit(values, influences, 1)
-            p = np.poly1d(z)
-            x_range = np.linspace(min(values), max(values), 100)
+        if values and all(isinstance(v, (int, float)) for v in values):
+            # Closed-form degree-1 least squares: two dot products
+            # instead of polyfit's Vandermonde/SVD machinery.
+            x = np.asarray(values, dtype=np.float64)
+            y = np.asarray(influences, dtype=np.float64)
+            xm = x.mean()
+            ym = y.mean()
+            dx = x - xm
+            denom = dx @ dx
+            slope = (dx @ (y - ym)) / denom if denom > 0.0 else 0.0
+            intercept = ym - slope * xm
+            x_range = np.linspace(x.min(), x.max(), 100)
 
             fig.add_trace(go.Scatter(
                 x=x_range,
-                y=p(x_range),
+                y=slope * x_range + intercept,
                 mode='lines',
                 name='Trend',
-                line=dict(dash='dash')
+                line=dict(dash='dash'),
+                _validate=False
             ))
 
         fig.update_layout(
@@ -966,22 +1182,29 @@ class ExplanationVisualizer:
         Returns:
             go.Figure: Decision outcome analysis visualization
         """
-        # Collect outcome data
-        data = []
-        for exp in explanations:
-            outcome = exp.metadata.get('outcome', 'unknown')
-            data.append({
-                'timestamp': exp.timestamp,
-                'confidence': exp.confidence,
-                'outcome': outcome,
-                'decision_type': exp.metadata.get('decision_type', 'unknown'),
-                'top_factor': max(
-                    exp.context_influence.items(),
-                    key=lambda x: x[1].influence_score
-                )[0]
-            })
-
-        df = pd.DataFrame(data)
+        # Build typed columns directly so pandas skips dtype inference
+        count = len(explanations)
+        df = pd.DataFrame({
+            'timestamp': np.fromiter(
+                (np.datetime64(exp.timestamp) for exp in explanations),
+                dtype='datetime64[ns]',
+                count=count
+            ),
+            'confidence': np.fromiter(
+                (exp.confidence for exp in explanations),
+                dtype=np.float32,
+                count=count
+            ),
+            'outcome': pd.Categorical([
+                exp.metadata.get('outcome', 'unknown')
+                for exp in explanations
+            ]),
+            'decision_type': pd.Categorical([
+                exp.metadata.get('decision_type', 'unknown')
+                for exp in explanations
+            ]),
+            'top_factor': [exp.top_factor[0] for exp in explanations]
+        })
 
         # Create figure with secondary y-axis
         fig = make_subplots(
@@ -994,21 +1217,32 @@ class ExplanationVisualizer:
             vertical_spacing=0.2
         )
 
-        # Add outcome distribution
-        outcome_counts = df.groupby(['decision_type', 'outcome']).size().unstack()
-        fig.add_trace(
+        # Add outcome distribution; the categorical columns already
+        # carry integer codes, so the 2D count table is one bincount
+        # over the combined code, and one add_traces call attaches a
+        # bar per outcome
+        dt_types = df['decision_type'].cat.categories
+        outcomes = df['outcome'].cat.categories
+        counts = np.bincount(
+            df['decision_type'].cat.codes.to_numpy() * len(outcomes)
+            + df['outcome'].cat.codes.to_numpy(),
+            minlength=len(dt_types) * len(outcomes)
+        ).reshape(len(dt_types), len(outcomes))
+        bars = [
             go.Bar(
-                x=outcome_counts.index,
-                y=outcome_counts[col],
+                x=dt_types,
+                y=counts[:, j],
                 name=col,
                 hovertemplate=(
                     "Decision Type: %{x}<br>"
                     f"Outcome: {col}<br>"
                     "Count: %{y}<br>"
                     "<extra></extra>"
-                )
-            ) for col in outcome_counts.columns
-        )
+                ),
+                _validate=False
+            ) for j, col in enumerate(outcomes)
+        ]
+        fig.add_traces(bars, rows=[1] * len(bars), cols=[1] * len(bars))
 
         # Add confidence vs outcome box plot
         fig.add_trace(
@@ -1023,13 +1257,15 @@ class ExplanationVisualizer:
                     "Outcome: %{x}<br>"
                     "Confidence: %{y:.2%}<br>"
                     "<extra></extra>"
-                )
+                ),
+                _validate=False
             ),
             row=2,
             col=1
         )
 
-        # Update layout
+        # One batched layout update instead of an update_layout call
+        # plus one update_yaxes validation pass per subplot
         fig.update_layout(
             title="Decision Outcome Analysis",
             showlegend=True,
@@ -1039,13 +1275,11 @@ class ExplanationVisualizer:
                 y=0.99,
                 xanchor="left",
                 x=0.01
-            )
+            ),
+            yaxis=dict(title='Count'),
+            yaxis2=dict(title='Confidence')
         )
 
-        # Update y-axes
-        fig.update_yaxes(title_text="Count", row=1, col=1)
-        fig.update_yaxes(title_text="Confidence", row=2, col=1)
-
         return fig
 
     def create_decision_comparison(
@@ -1071,37 +1305,48 @@ class ExplanationVisualizer:
                 "Confidence Breakdown",
                 "Category Distribution",
                 "Reasoning Steps"
-            )
+            ),
+            # Indicator, pie and table traces need their own subplot
+            # types; the default xy grid rejects them
+            specs=[
+                [{'type': 'xy'}, {'type': 'indicator'}],
+                [{'type': 'domain'}, {'type': 'table'}]
+            ]
         )
 
-        # Get common factors
-        all_factors = set(explanation1.context_influence.keys()) | set(
-            explanation2.context_influence.keys()
-        )
+        # Materialize the union of factors once; the tuple fixes the
+        # x-axis order and is iterated three times below
+        influence1 = explanation1.context_influence
+        influence2 = explanation2.context_influence
+        factor_names = tuple(influence1.keys() | influence2.keys())
+        n_factors = len(factor_names)
 
         # Add factor influence comparison
-        factors1 = [
-            explanation1.context_influence.get(
-                f, ContextFactor(name=f, value="", influence_score=0,
-                                 confidence=0, category="")
-            ).influence_score
-            for f in all_factors
-        ]
-        factors2 = [
-            explanation2.context_influence.get(
-                f, ContextFactor(name=f, value="", influence_score=0,
-                                 confidence=0, category="")
-            ).influence_score
-            for f in all_factors
-        ]
+        factors1 = np.fromiter(
+            (
+                influence1[f].influence_score if f in influence1 else 0.0
+                for f in factor_names
+            ),
+            dtype=np.float32,
+            count=n_factors
+        )
+        factors2 = np.fromiter(
+            (
+                influence2[f].influence_score if f in influence2 else 0.0
+                for f in factor_names
+            ),
+            dtype=np.float32,
+            count=n_factors
+        )
 
         fig.add_trace(
             go.Bar(
                 name="Decision 1",
-                x=list(all_factors),
+                x=factor_names,
                 y=factors1,
                 text=[f"{v:.1%}" for v in factors1],
                 textposition='auto',
+                _validate=False
             ),
             row=1,
             col=1
@@ -1109,10 +1354,11 @@ class ExplanationVisualizer:
         fig.add_trace(
             go.Bar(
                 name="Decision 2",
-                x=list(all_factors),
+                x=factor_names,
                 y=factors2,
                 text=[f"{v:.1%}" for v in factors2],
                 textposition='auto',
+                _validate=False
             ),
             row=1,
             col=1
@@ -1125,19 +1371,20 @@ class ExplanationVisualizer:
                 value=explanation1.confidence,
                 delta={'reference': explanation2.confidence},
                 gauge={'axis': {'range': [0, 1]}},
-                title={'text': "Confidence Comparison"}
+                title={'text': "Confidence Comparison"},
+                _validate=False
             ),
             row=1,
             col=2
         )
 
-        # Add category distribution
-        categories1 = {}
-        categories2 = {}
-        for f in explanation1.context_influence.values():
-            categories1[f.category] = categories1.get(f.category, 0) + 1
-        for f in explanation2.context_influence.values():
-            categories2[f.category] = categories2.get(f.category, 0) + 1
+        # Add category distribution; Counter runs the tally in C
+        categories1 = Counter(
+            f.category for f in explanation1.context_influence.values()
+        )
+        categories2 = Counter(
+            f.category for f in explanation2.context_influence.values()
+        )
 
         fig.add_trace(
             go.Pie(
@@ -1145,7 +1392,8 @@ class ExplanationVisualizer:
                 values=list(categories1.values()),
                 name="Decision 1",
                 domain={'x': [0, 0.45], 'y': [0, 0.45]},
-                showlegend=False
+                showlegend=False,
+                _validate=False
             ),
             row=2,
             col=1
@@ -1156,7 +1404,8 @@ class ExplanationVisualizer:
                 values=list(categories2.values()),
                 name="Decision 2",
                 domain={'x': [0.55, 1], 'y': [0, 0.45]},
-                showlegend=False
+                showlegend=False,
+                _validate=False
             ),
             row=2,
             col=1
@@ -1175,7 +1424,8 @@ class ExplanationVisualizer:
                 cells=dict(
                     values=[explanation1.reasoning_steps, explanation2.reasoning_steps],
                     align='left'
-                )
+                ),
+                _validate=False
             ),
             row=2,
             col=2
@@ -1196,3 +1446,45 @@ class ExplanationVisualizer:
         )
 
         return fig
+
+    def render_all(
+        self,
+        explanations: List[Explanation]
+    ) -> Dict[str, go.Figure]:
+        """Build every list-level chart for one set of explanations.
+
+        Materializes the shared factor table once, then fans the
+        independent figure builds out over a thread pool — each build
+        is Plotly construction plus NumPy reductions, which release
+        the GIL enough to overlap. One walk over the objects replaces
+        a full walk per chart.
+
+        Args:
+            explanations: List of explanations to visualize
+
+        Returns:
+            Dict[str, go.Figure]: Figures keyed by chart name
+        """
+        builders = {
+            'confidence_trend': self.create_confidence_trend,
+            'category_distribution': self.create_category_distribution,
+            'correlation_heatmap': self.create_factor_correlation_heatmap,
+            'timeline': self.create_decision_timeline,
+            'sankey': self.create_decision_sankey,
+            'importance_trend': self.create_factor_importance_trend,
+            'category_evolution': self.create_category_evolution,
+            'confidence_distribution': self.create_confidence_distribution,
+            'category_comparison': self.create_category_comparison,
+            'outcome_analysis': self.create_outcome_analysis,
+        }
+
+        # Warm the shared caches on this thread so workers reuse them
+        # instead of racing to build the same table.
+        self._materialize(explanations)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                name: pool.submit(build, explanations)
+                for name, build in builders.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
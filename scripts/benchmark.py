@@ -2,12 +2,14 @@
 """Benchmark script for IntelliAgent."""
 
 import time
-import statistics
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple
 import argparse
 import json
 from datetime import datetime
 
+import numpy as np
+
 from intelliagent import DecisionMaker
 from intelliagent.utils import DataProcessor
 
@@ -15,40 +17,53 @@ from intelliagent.utils import DataProcessor
 def run_benchmark(
     iterations: int,
     test_cases: List[str],
-    api_key: str
+    api_key: str,
+    concurrency: int = 8
 ) -> Dict:
-    """Run benchmark tests."""
+    """Run benchmark tests.
+
+    Wall clock is dominated by provider latency, not CPU, so the
+    cases run concurrently on a thread pool up to ``concurrency``
+    in-flight requests.
+    """
     agent = DecisionMaker(api_key=api_key)
 
-    latencies = []
-    results = []
+    def run_one(case: str) -> Tuple[str, float, Dict]:
+        case_start = time.perf_counter()
+        result = agent.make_decision("benchmark_user", case)
+        return case, time.perf_counter() - case_start, result
 
-    start_time = time.time()
+    cases = [case for _ in range(iterations) for case in test_cases]
 
-    for _ in range(iterations):
-        for case in test_cases:
-            case_start = time.time()
-            result = agent.make_decision("benchmark_user", case)
-            latency = time.time() - case_start
+    latencies = np.empty(len(cases), dtype=np.float64)
+    results = []
+
+    start_time = time.perf_counter()
 
-            latencies.append(latency)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for idx, (case, latency, result) in enumerate(
+            executor.map(run_one, cases)
+        ):
+            latencies[idx] = latency
             results.append({
                 "case": case,
                 "latency": latency,
                 "result": result
             })
 
-    total_time = time.time() - start_time
+    total_time = time.perf_counter() - start_time
+
+    quantiles = np.quantile(latencies, [0.5, 0.95])
 
     return {
         "timestamp": datetime.now().isoformat(),
         "iterations": iterations,
         "total_time": total_time,
-        "avg_latency": statistics.mean(latencies),
-        "median_latency": statistics.median(latencies),
-        "p95_latency": statistics.quantiles(latencies, n=20)[-1],
-        "min_latency": min(latencies),
-        "max_latency": max(latencies),
+        "avg_latency": float(latencies.mean()),
+        "median_latency": float(quantiles[0]),
+        "p95_latency": float(quantiles[1]),
+        "min_latency": float(latencies.min()),
+        "max_latency": float(latencies.max()),
         "results": results
     }
 
@@ -56,6 +71,7 @@ def run_benchmark(
 def main():
     parser = argparse.ArgumentParser(description="Run IntelliAgent benchmarks")
     parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
     parser.add_argument("--output", type=str, default="benchmark_results.json")
     parser.add_argument("--api-key", type=str, required=True)
     args = parser.parse_args()
@@ -67,7 +83,9 @@ def main():
     ]
 
     print(f"Running benchmark with {args.iterations} iterations...")
-    results = run_benchmark(args.iterations, test_cases, args.api_key)
+    results = run_benchmark(
+        args.iterations, test_cases, args.api_key, args.concurrency
+    )
 
     with open(args.output, 'w') as f:
         json.dump(results, f, indent=2)
@@ -42,6 +42,7 @@ setup(
             "pytest>=6.0",
             "pytest-cov>=2.0",
             "pytest-benchmark>=3.4.1",
+            "pytest-xdist>=2.5",
             "black>=22.0",
             "isort>=5.0",
             "flake8>=3.9",
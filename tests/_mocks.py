@@ -0,0 +1,42 @@
+"""Shared test doubles for agent health probing. PYTEST_DONT_REWRITE
+
+The marker keeps pytest from AST-rewriting this module on import; it
+holds no assertions, so rewriting is pure collection overhead.
+"""
+
+
+class HealthyModel:
+    def process_input(self, *args, **kwargs):
+        return True
+
+
+class FailingModel:
+    def process_input(self, *args, **kwargs):
+        raise Exception("Test error")
+
+
+class Cache:
+    cache = {"key": "value"}
+
+
+class MemoryManager:
+    memories = ["memory1", "memory2"]
+
+
+class ErrorHandler:
+    def __init__(self, errors):
+        self._errors = errors
+
+    def get_error_log(self, limit):
+        return self._errors[:limit]
+
+
+def make_agent(model, errors, with_state=True):
+    """Build a minimal agent double for health probing."""
+    agent = type("Agent", (), {})()
+    agent.model = model
+    agent.error_handler = ErrorHandler(errors)
+    if with_state:
+        agent.cache = Cache()
+        agent.memory_manager = MemoryManager()
+    return agent
@@ -1,17 +1,50 @@
 """Shared test fixtures."""
 import pytest
 from intelliagent import DecisionMaker
+from intelliagent.core.explainability import ExplainabilityEngine
 from intelliagent.models import GPTModel
 from intelliagent.utils import ContextAnalyzer, DataProcessor
 
+# Canonical (decision, context, thought_chain, confidence) inputs used to
+# seed the shared explainability engine below.
+_CANONICAL_EXPLANATIONS = {
+    "invest": (
+        "Should invest",
+        {"funds": "available"},
+        [{"content": "Investment possible", "confidence": 0.8}],
+        0.8,
+    ),
+    "simple": (
+        "Test decision",
+        {"test_factor": "value"},
+        [{"content": "Test thought", "confidence": 0.8}],
+        0.8,
+    ),
+    "factors": (
+        "Test decision",
+        {"priority_factor": "high", "risk_level": "medium", "user_age": 25},
+        [{"content": "Test thought", "confidence": 0.8}],
+        0.8,
+    ),
+    "two_thoughts": (
+        "Test decision",
+        {"priority_factor": "high", "risk_level": "medium", "user_age": 25},
+        [
+            {"content": "First thought", "confidence": 0.8},
+            {"content": "Second thought", "confidence": 0.9},
+        ],
+        0.85,
+    ),
+}
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def api_key():
     """Dummy API key for testing."""
     return "test-api-key-12345"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def decision_maker(api_key):
     """Create a DecisionMaker instance for testing."""
     return DecisionMaker(
@@ -22,7 +55,7 @@ def decision_maker(api_key):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gpt_model(api_key):
     """Create a GPTModel instance for testing."""
     return GPTModel(
@@ -33,19 +66,52 @@ def gpt_model(api_key):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def context_analyzer():
     """Create a ContextAnalyzer instance for testing."""
     return ContextAnalyzer()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data_processor():
     """Create a DataProcessor instance for testing."""
     return DataProcessor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def assert_keys():
+    """Assert a dict contains the given keys via one set difference."""
+    def _assert_keys(d, keys):
+        missing = set(keys) - d.keys()
+        assert not missing, f"missing keys: {missing}"
+    return _assert_keys
+
+
+@pytest.fixture(scope="session")
+def prebuilt_engine():
+    """ExplainabilityEngine with the canonical explanations pre-generated.
+
+    Decision ids are timestamped to the second and collide when generated
+    back to back, so each canonical explanation is re-keyed to a stable id.
+    Yields ``(engine, ids)`` where ``ids`` maps canonical names to decision
+    ids. Only read-only tests should use this; tests that mutate engine
+    state build their own instance.
+    """
+    engine = ExplainabilityEngine()
+    ids = {}
+    for name, (decision, context, chain, confidence) in \
+            _CANONICAL_EXPLANATIONS.items():
+        explanation = engine.generate_explanation(
+            decision, context, chain, confidence
+        )
+        del engine.explanations[explanation.decision_id]
+        explanation.decision_id = f"exp_{name}"
+        engine.explanations[explanation.decision_id] = explanation
+        ids[name] = explanation.decision_id
+    return engine, ids
+
+
+@pytest.fixture(scope="session")
 def sample_context():
     """Create a sample context for testing."""
     return {
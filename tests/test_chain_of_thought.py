@@ -8,6 +8,31 @@ def chain():
     return ChainOfThought()
 
 
+@pytest.fixture(scope="module")
+def linked_chain():
+    """Prebuilt three-thought chain shared by the read-only tests.
+
+    Returns ``(chain, ids)``; the first two thoughts are linked and carry
+    an evolving context so the same chain serves the retrieval and
+    analysis variants.
+    """
+    chain = ChainOfThought()
+    ids = [chain.add_thought("First", 0.8, {"key1": "value1", "key2": "old"})]
+    ids.append(chain.add_thought(
+        "Second",
+        0.6,
+        {"key1": "value1", "key2": "new"},
+        previous_thought_id=ids[0]
+    ))
+    ids.append(chain.add_thought(
+        "Third",
+        0.7,
+        {},
+        previous_thought_id=ids[1]
+    ))
+    return chain, ids
+
+
 def test_add_thought(chain):
     content = "Test thought"
     confidence = 0.8
@@ -23,49 +48,24 @@ def test_add_thought(chain):
     assert chain.thoughts[0].context == context
 
 
-def test_get_chain_no_thought_id(chain):
-    # Add multiple thoughts
-    chain.add_thought("First thought", 0.8, {})
-    thought_id = chain.add_thought("Second thought", 0.9, {})
-
-    # Get current chain
-    thought_chain = chain.get_chain()
-
-    assert len(thought_chain) == 2
-    assert thought_chain[-1].content == "Second thought"
+@pytest.mark.parametrize("from_thought,expected", [
+    (None, ["First", "Second", "Third"]),
+    (1, ["First", "Second"]),
+])
+def test_get_chain(linked_chain, from_thought, expected):
+    chain, ids = linked_chain
 
+    thought_id = ids[from_thought] if from_thought is not None else None
+    thought_chain = chain.get_chain(thought_id)
 
-def test_get_chain_with_thought_id(chain):
-    # Create a chain of thoughts
-    first_id = chain.add_thought("First", 0.8, {})
-    second_id = chain.add_thought(
-        "Second",
-        0.9,
-        {},
-        previous_thought_id=first_id
-    )
-    chain.add_thought(
-        "Third",
-        0.7,
-        {},
-        previous_thought_id=second_id
-    )
-
-    # Get chain for second thought
-    chain_for_second = chain.get_chain(second_id)
-
-    assert len(chain_for_second) == 2
-    assert chain_for_second[0].content == "First"
-    assert chain_for_second[1].content == "Second"
+    assert [thought.content for thought in thought_chain] == expected
 
 
-def test_analyze_chain(chain):
-    # Create a chain with known values
-    chain.add_thought("First", 0.8, {"context": "initial"})
-    thought_id = chain.add_thought("Second", 0.6, {"context": "updated"})
+def test_analyze_chain(linked_chain):
+    chain, ids = linked_chain
 
-    # Get and analyze the chain
-    thought_chain = chain.get_chain(thought_id)
+    # Analyze the linked pair with known confidences
+    thought_chain = chain.get_chain(ids[1])
     analysis = chain.analyze_chain(thought_chain)
 
     assert "length" in analysis
@@ -75,21 +75,11 @@ def test_analyze_chain(chain):
     assert "context_evolution" in analysis
 
 
-def test_analyze_context_evolution(chain):
-    # Create thoughts with changing context
-    chain.add_thought(
-        "First",
-        0.8,
-        {"key1": "value1", "key2": "old"}
-    )
-    thought_id = chain.add_thought(
-        "Second",
-        0.9,
-        {"key1": "value1", "key2": "new"}
-    )
+def test_analyze_context_evolution(linked_chain):
+    chain, ids = linked_chain
 
-    # Get and analyze the chain
-    thought_chain = chain.get_chain(thought_id)
+    # The linked pair changes key2 between thoughts
+    thought_chain = chain.get_chain(ids[1])
     analysis = chain.analyze_chain(thought_chain)
 
     context_changes = analysis["context_evolution"]
@@ -33,20 +33,11 @@ def test_generate_explanation(engine):
     assert all(0 <= v <= 1 for v in explanation.context_influence.values())
 
 
-def test_visualize_explanation(engine):
+def test_visualize_explanation(prebuilt_engine):
     """Test explanation visualization."""
-    # First generate an explanation
-    decision = "Sell stocks"
-    context = {"market_trend": "down"}
-    thought_chain = [{"content": "Market is declining", "confidence": 0.9}]
-    confidence = 0.9
+    engine, ids = prebuilt_engine
 
-    explanation = engine.generate_explanation(
-        decision, context, thought_chain, confidence
-    )
-
-    # Test visualization
-    visualization = engine.visualize_explanation(explanation.decision_id)
+    visualization = engine.visualize_explanation(ids["invest"])
 
     assert isinstance(visualization, str)
     assert "Decision ID" in visualization
@@ -97,16 +88,10 @@ def test_explanation_with_empty_context(engine):
     assert explanation.metadata["context_size"] == 0
 
 
-def test_explanation_metadata(engine):
+def test_explanation_metadata(prebuilt_engine):
     """Test explanation metadata generation."""
-    decision = "Should invest"
-    context = {"funds": "available"}
-    thought_chain = [{"content": "Investment possible", "confidence": 0.8}]
-    confidence = 0.8
-
-    explanation = engine.generate_explanation(
-        decision, context, thought_chain, confidence
-    )
+    engine, ids = prebuilt_engine
+    explanation = engine.get_explanation(ids["invest"])
 
     assert explanation.metadata["decision_type"] == "recommendation"
     assert explanation.metadata["context_size"] == 1
@@ -125,7 +110,7 @@ def test_advanced_context_influence(engine):
     influence = engine._analyze_context_influence(context)
 
     assert len(influence) == 4
-    assert all(isinstance(v, ContextFactor) for v in influence.values())
+    assert {type(v) for v in influence.values()} == {ContextFactor}
     assert influence["priority_factor"].influence_score > influence["user_age"].influence_score
     assert influence["user_age"].category == "numerical"
     assert influence["timestamp"].category == "temporal"
@@ -140,18 +125,12 @@ def test_factor_confidence_calculation(engine):
     assert 0 < engine._calculate_factor_confidence("test") < 1
 
 
-def test_text_visualization_format(engine):
+def test_text_visualization_format(prebuilt_engine):
     """Test text format visualization."""
-    decision = "Test decision"
-    context = {"test_factor": "value"}
-    thought_chain = [{"content": "Test thought", "confidence": 0.8}]
-
-    explanation = engine.generate_explanation(
-        decision, context, thought_chain, 0.8
-    )
+    engine, ids = prebuilt_engine
 
     text_viz = engine.visualize_explanation(
-        explanation.decision_id,
+        ids["simple"],
         format='text'
     )
 
@@ -192,22 +171,11 @@ def test_compare_explanations(engine):
     assert len(comparison["context_changes"]["unchanged"]) == 1
 
 
-def test_explanation_summary(engine):
+def test_explanation_summary(prebuilt_engine):
     """Test explanation summarization."""
-    context = {
-        "priority_factor": "high",
-        "risk_level": "medium",
-        "user_age": 25
-    }
-
-    explanation = engine.generate_explanation(
-        "Test decision",
-        context,
-        [{"content": "Test thought", "confidence": 0.8}],
-        0.8
-    )
+    engine, ids = prebuilt_engine
 
-    summary = engine.summarize_explanation(explanation.decision_id)
+    summary = engine.summarize_explanation(ids["factors"])
 
     assert isinstance(summary, str)
     assert "confidence" in summary.lower()
@@ -233,54 +201,28 @@ def test_historical_analysis(engine):
     assert analysis["confidence_trend"]["trend"] == "increasing"
 
 
-def test_medium_summary_format(engine):
+def test_medium_summary_format(prebuilt_engine):
     """Test medium-length summary generation."""
-    context = {
-        "priority_factor": "high",
-        "risk_level": "medium",
-        "user_age": 25
-    }
-    thought_chain = [
-        {"content": "First thought", "confidence": 0.8},
-        {"content": "Second thought", "confidence": 0.9}
-    ]
-
-    explanation = engine.generate_explanation(
-        "Test decision",
-        context,
-        thought_chain,
-        0.85
-    )
+    engine, ids = prebuilt_engine
 
     summary = engine.summarize_explanation(
-        explanation.decision_id,
+        ids["two_thoughts"],
         format='medium'
     )
 
     assert "Decision Analysis" in summary
     assert "Key Factors" in summary
     assert "Reasoning Steps" in summary
-    assert all(f"- {thought['content']}" in summary for thought in thought_chain)
+    assert "- First thought" in summary
+    assert "- Second thought" in summary
 
 
-def test_long_summary_format(engine):
+def test_long_summary_format(prebuilt_engine):
     """Test detailed summary generation."""
-    context = {
-        "priority_factor": "high",
-        "risk_level": "medium",
-        "user_age": 25
-    }
-    thought_chain = [{"content": "Test thought", "confidence": 0.8}]
-
-    explanation = engine.generate_explanation(
-        "Test decision",
-        context,
-        thought_chain,
-        0.8
-    )
+    engine, ids = prebuilt_engine
 
     summary = engine.summarize_explanation(
-        explanation.decision_id,
+        ids["factors"],
         format='long'
     )
 
@@ -292,7 +234,7 @@ def test_long_summary_format(engine):
     )
 
 
-def test_category_distribution_analysis(engine):
+def test_category_distribution_analysis(engine, assert_keys):
     """Test analysis of context factor categories."""
     # Generate explanations with different categories
     contexts = [
@@ -312,10 +254,6 @@ def test_category_distribution_analysis(engine):
     analysis = engine.get_historical_analysis()
     distribution = analysis["category_distribution"]
 
-    assert "temporal" in distribution
-    assert "numerical" in distribution
-    assert "user" in distribution
-    assert all(
-        "percentage" in stats and "avg_influence" in stats
-        for stats in distribution.values()
-    )
+    assert_keys(distribution, {"temporal", "numerical", "user"})
+    for stats in distribution.values():
+        assert_keys(stats, {"percentage", "avg_influence"})
@@ -2,8 +2,10 @@ import pytest
 from datetime import datetime, timedelta
 from intelliagent.monitoring.health_check import HealthMonitor
 
+from _mocks import FailingModel, HealthyModel, make_agent
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def monitor():
     return HealthMonitor()
 
@@ -24,28 +26,7 @@ def test_get_system_health(monitor):
 
 
 def test_get_agent_health(monitor):
-    class MockAgent:
-        def __init__(self):
-            self.cache = MockCache()
-            self.memory_manager = MockMemoryManager()
-            self.model = MockModel()
-            self.error_handler = MockErrorHandler()
-
-    class MockCache:
-        cache = {"key": "value"}
-
-    class MockMemoryManager:
-        memories = ["memory1", "memory2"]
-
-    class MockModel:
-        def process_input(self, *args, **kwargs):
-            return True
-
-    class MockErrorHandler:
-        def get_error_log(self, limit):
-            return []
-
-    agent = MockAgent()
+    agent = make_agent(HealthyModel(), errors=[])
     health = monitor.get_agent_health(agent)
 
     assert isinstance(health, dict)
@@ -55,23 +36,17 @@ def test_get_agent_health(monitor):
     assert health["last_error"] is None
 
 
-def test_agent_health_with_errors(monitor):
-    class ErrorAgent:
-        def __init__(self):
-            self.model = ErrorModel()
-            self.error_handler = ErrorHandler()
-
-    class ErrorModel:
-        def process_input(self, *args, **kwargs):
-            raise Exception("Test error")
-
-    class ErrorHandler:
-        def get_error_log(self, limit):
-            return ["Recent error"]
-
-    agent = ErrorAgent()
+@pytest.mark.parametrize("model,errors,status_parts,last_error", [
+    (FailingModel(), ["Recent error"], ("unhealthy", "Test error"),
+     "Recent error"),
+    (HealthyModel(), ["Recent error"], ("healthy",), "Recent error"),
+])
+def test_agent_health_with_errors(
+    monitor, model, errors, status_parts, last_error
+):
+    agent = make_agent(model, errors, with_state=False)
     health = monitor.get_agent_health(agent)
 
-    assert "unhealthy" in health["model_status"]
-    assert "Test error" in health["model_status"]
-    assert health["last_error"] == "Recent error"
+    for part in status_parts:
+        assert part in health["model_status"]
+    assert health["last_error"] == last_error
@@ -1,7 +1,15 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
 import pytest
-import time
+
 from intelliagent.profiling.performance_profiler import PerformanceProfiler
 
+# Fixed instants handed to the mocked clock; keeps the duration
+# assertions meaningful without burning real wall-clock time
+_START = datetime(2024, 1, 1, 12, 0, 0)
+_END = _START + timedelta(seconds=0.1)
+
 
 @pytest.fixture
 def profiler():
@@ -11,10 +19,13 @@ def profiler():
 def test_profile_decorator(profiler):
     @profiler.profile
     def test_function():
-        time.sleep(0.1)
         return "test"
 
-    result = test_function()
+    with patch(
+        'intelliagent.profiling.performance_profiler.datetime'
+    ) as mock_datetime:
+        mock_datetime.now.side_effect = [_START, _END]
+        result = test_function()
 
     assert result == "test"
     assert len(profiler.profiles) == 1
@@ -26,9 +37,12 @@ def test_profile_decorator(profiler):
 
 
 def test_manual_profiling(profiler):
-    profiler.start_profiling("test_section")
-    time.sleep(0.1)
-    results = profiler.stop_profiling()
+    with patch(
+        'intelliagent.profiling.performance_profiler.datetime'
+    ) as mock_datetime:
+        mock_datetime.now.side_effect = [_START, _END]
+        profiler.start_profiling("test_section")
+        results = profiler.stop_profiling()
 
     assert "duration" in results
     assert results["duration"] >= 0.1
@@ -56,9 +70,12 @@ def test_profile_stats_format(profiler):
     @profiler.profile
     def complex_function():
         sum(range(1000))
-        time.sleep(0.1)
 
-    complex_function()
+    with patch(
+        'intelliagent.profiling.performance_profiler.datetime'
+    ) as mock_datetime:
+        mock_datetime.now.side_effect = [_START, _END]
+        complex_function()
 
     profile = next(iter(profiler.profiles.values()))
     stats = profiler._format_stats(profile)
@@ -1,6 +1,5 @@
 """Tests for benchmarking utilities."""
 
-import time
 from unittest.mock import patch
 import pytest
 
@@ -16,7 +15,6 @@ def test_benchmark_decorator():
     """Test benchmark decorator."""
     @benchmark(name="test_func", iterations=3)
     def test_function():
-        time.sleep(0.1)
         return 42
 
     result = test_function()
@@ -0,0 +1,130 @@
+"""Shared fixtures for the visualization tests."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from intelliagent.core.explainability import ContextFactor, Explanation
+from intelliagent.visualization.explanation_visualizer import ExplanationVisualizer
+
+# Frozen reference instant; keeps fixtures deterministic and avoids a
+# clock read per construction
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def visualizer():
+    return ExplanationVisualizer()
+
+
+@pytest.fixture(scope="session")
+def sample_explanation():
+    return Explanation(
+        decision_id="test_decision",
+        reasoning_steps=["Step 1", "Step 2"],
+        evidence={"source1": ["evidence1"]},
+        confidence=0.8,
+        metadata={"decision_type": "recommendation"},
+        timestamp=NOW,
+        context_influence={
+            "factor1": ContextFactor(
+                name="factor1",
+                value="value1",
+                influence_score=0.6,
+                confidence=0.8,
+                category="category1"
+            ),
+            "factor2": ContextFactor(
+                name="factor2",
+                value="value2",
+                influence_score=0.4,
+                confidence=0.7,
+                category="category2"
+            )
+        },
+        key_factors=["factor1", "factor2"]
+    )
+
+
+def _explanation(decision_id, hours, factors, metadata):
+    """Build a corpus variant; factors is name -> (value, score, conf, cat)."""
+    influence = {
+        name: ContextFactor(name, value, score, conf, category)
+        for name, (value, score, conf, category) in factors.items()
+    }
+    return Explanation(
+        decision_id=decision_id,
+        reasoning_steps=["Step 1"],
+        evidence={"source1": ["evidence1"]},
+        confidence=0.7,
+        metadata=metadata,
+        timestamp=NOW + timedelta(hours=hours),
+        context_influence=influence,
+        key_factors=list(influence)
+    )
+
+
+@pytest.fixture(scope="session")
+def built_charts(visualizer, sample_explanation, explanation_corpus):
+    """Charts built once per session for read-only assertions.
+
+    Figure construction dominates per-test cost; tests that only inspect
+    the result pull from this dict instead of rebuilding."""
+    explanations = [sample_explanation]
+    return {
+        "influence": visualizer.create_influence_chart(sample_explanation),
+        "confidence_trend": visualizer.create_confidence_trend(explanations),
+        "category_distribution": visualizer.create_category_distribution(
+            explanations
+        ),
+        "decision_flow": visualizer.create_decision_flow(sample_explanation),
+        "sankey": visualizer.create_decision_sankey(sample_explanation),
+        "heatmap": visualizer.create_factor_correlation_heatmap(
+            list(explanation_corpus[:2])
+        ),
+        "timeline": visualizer.create_decision_timeline(
+            [explanation_corpus[0], explanation_corpus[2]]
+        ),
+        "importance_trend": visualizer.create_factor_importance_trend(
+            [explanation_corpus[0], explanation_corpus[3]]
+        ),
+        "category_evolution": visualizer.create_category_evolution(
+            list(explanation_corpus[:2])
+        ),
+    }
+
+
+@pytest.fixture(scope="session")
+def explanation_corpus(sample_explanation):
+    """Prebuilt explanations covering the multi-explanation test variants.
+
+    Index 0 is the shared sample; the rest vary factors, categories,
+    decision type, outcome and timestamp so tests pick the pair they
+    need instead of constructing explanations inline.
+    """
+    return (
+        sample_explanation,
+        _explanation(
+            "test_decision_b", 1,
+            {"factor1": ("value1", 0.3, 0.8, "category1"),
+             "factor3": ("value3", 0.7, 0.9, "category3")},
+            {"decision_type": "recommendation"}
+        ),
+        _explanation(
+            "test_decision_c", 2,
+            {"factor1": ("value1", 0.8, 0.7, "category1")},
+            {"decision_type": "classification", "outcome": "success"}
+        ),
+        _explanation(
+            "test_decision_d", 3,
+            {"factor1": ("value1", 0.4, 0.8, "category1"),
+             "factor2": ("value2", 0.6, 0.7, "category2")},
+            {"decision_type": "recommendation"}
+        ),
+        _explanation(
+            "test_decision_e", 0,
+            {"factor1": ("value2", 0.8, 0.7, "category1"),
+             "factor3": ("value3", 0.3, 0.9, "category3")},
+            {"decision_type": "recommendation"}
+        ),
+    )
@@ -1,11 +1,26 @@
 """Tests for the explanation dashboard."""
 
+import inspect
+
 import pytest
 from unittest.mock import MagicMock, patch
 
-from intelliagent.visualization.dashboard import ExplanationDashboard
 from intelliagent.core.explainability import ExplainabilityEngine, Explanation
-from intelliagent.visualization.explanation_visualizer import ExplanationVisualizer
+
+# Keep streamlit/plotly out of collection for runs that skip these tests
+streamlit = pytest.importorskip("streamlit")
+
+pytestmark = pytest.mark.dashboard
+
+
+FAKE_EXPLANATION = MagicMock(spec=Explanation)
+FAKE_EXPLANATIONS = [FAKE_EXPLANATION, FAKE_EXPLANATION]
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_explanation():
+    """Clear call records on the shared mock between tests."""
+    FAKE_EXPLANATION.reset_mock()
 
 
 @pytest.fixture
@@ -17,12 +32,18 @@ def mock_engine():
 
 @pytest.fixture
 def mock_visualizer():
+    from intelliagent.visualization.explanation_visualizer import (
+        ExplanationVisualizer,
+    )
+
     visualizer = MagicMock(spec=ExplanationVisualizer)
     return visualizer
 
 
 @pytest.fixture
 def dashboard(mock_engine, mock_visualizer):
+    from intelliagent.visualization.dashboard import ExplanationDashboard
+
     return ExplanationDashboard(mock_engine, mock_visualizer)
 
 
@@ -59,8 +80,7 @@ def test_show_overview_metrics(mock_columns, dashboard):
 @patch('streamlit.plotly_chart')
 def test_show_explanation_details(mock_chart, dashboard, mock_visualizer):
     """Test explanation details display."""
-    explanation = MagicMock(spec=Explanation)
-    dashboard._show_explanation_details(explanation)
+    dashboard._show_explanation_details(FAKE_EXPLANATION)
 
     assert mock_chart.call_count == 2  # Two charts should be displayed
     dashboard.visualizer.create_influence_chart.assert_called_once()
@@ -70,7 +90,7 @@ def test_show_explanation_details(mock_chart, dashboard, mock_visualizer):
 @patch('streamlit.plotly_chart')
 def test_show_timeline(mock_chart, dashboard, mock_visualizer):
     """Test timeline visualization display."""
-    explanations = [MagicMock(spec=Explanation)]
+    explanations = FAKE_EXPLANATIONS[:1]
     dashboard._show_timeline(explanations)
 
     mock_chart.assert_called_once()
@@ -88,7 +108,7 @@ def test_show_correlations_with_insufficient_data(
     mock_visualizer
 ):
     """Test correlation analysis with insufficient data."""
-    explanations = [MagicMock(spec=Explanation)]
+    explanations = FAKE_EXPLANATIONS[:1]
     dashboard._show_correlations(explanations)
 
     mock_warning.assert_called_once()
@@ -98,8 +118,7 @@ def test_show_correlations_with_insufficient_data(
 @patch('streamlit.plotly_chart')
 def test_show_correlations(mock_chart, dashboard, mock_visualizer):
     """Test correlation analysis display."""
-    explanations = [MagicMock(spec=Explanation) for _ in range(2)]
-    dashboard._show_correlations(explanations)
+    dashboard._show_correlations(FAKE_EXPLANATIONS)
 
     mock_chart.assert_called_once()
     dashboard.visualizer.create_factor_correlation_heatmap.assert_called_once_with(
@@ -107,6 +126,14 @@ def test_show_correlations(mock_chart, dashboard, mock_visualizer):
     )
 
 
+def test_dashboard_class_defined_once():
+    """Guard against the class being accidentally redefined in-module."""
+    from intelliagent.visualization import dashboard as module
+
+    source = inspect.getsource(module)
+    assert source.count("class ExplanationDashboard") == 1
+
+
 def test_visualization_type_selection(dashboard):
     """Test visualization type selection."""
     with patch('streamlit.sidebar.selectbox') as mock_select: